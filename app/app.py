@@ -24,21 +24,34 @@ from dotenv import load_dotenv
 
 # App internals
 from app.config import Config
-from app.models import db, BlockRecord, init_database
+from app.models import db, BlockRecord, DisclosureRecord, init_database
 from core.logger import setup_logging, logging
 from core.crypto_utils import CryptoManager
+from core.signing_service import SigningService
 from core.blockchain import SimpleBlockchain
 from core.ipfs_client import IPFSClient
 from core.credential_manager import CredentialManager
+from core.disclosure_store import DisclosureStore
+from core.issuance_pipeline import IssuancePipeline
+from core.registry_replay import RegistryReplay
+from core.idempotency import IdempotencyStore
+from core.analytics import RegistryAnalytics
 from core.ticket_manager import TicketManager
 from core.zkp_manager import ZKPManager
 from core.mailer import CredifyMailer
 
 # Global Instances (Exported for Blueprints)
 crypto_manager = CryptoManager()
+signing_service = SigningService(crypto_manager)
 blockchain = SimpleBlockchain(crypto_manager, db=db, block_model=BlockRecord)
 ipfs_client = IPFSClient()
-credential_manager = CredentialManager(blockchain, crypto_manager, ipfs_client)
+credential_manager = CredentialManager(
+    blockchain, crypto_manager, ipfs_client, disclosure_store=DisclosureStore(db=db, model=DisclosureRecord)
+)
+issuance_pipeline = IssuancePipeline(credential_manager)
+registry_replay = RegistryReplay(credential_manager)
+idempotency_store = IdempotencyStore()
+registry_analytics = RegistryAnalytics(credential_manager)
 ticket_manager = TicketManager()
 zkp_manager = ZKPManager(crypto_manager)
 mailer = None  # Initialized inside create_app
@@ -48,6 +61,8 @@ def init_extensions(app):
     """Initialize third-party extensions and global state"""
     setup_logging()
     load_dotenv()
+    # Load/generate issuer keys off the startup path; the first signature waits if they are not ready yet
+    crypto_manager.provision_async()
 
     app.config.from_object(Config)
     app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL", "sqlite:///credentials.db")
@@ -58,6 +73,12 @@ def init_extensions(app):
     global mailer
     mailer = CredifyMailer(app)
 
+    crypto_manager.signing_algorithm = app.config.get("SIGNING_ALGORITHM", "PS256")
+    signing_service.workers = app.config.get("SIGNING_WORKERS", 0)
+    crypto_manager.signer = signing_service
+    crypto_manager.verify_cache_size = app.config.get("VERIFY_CACHE_SIZE", 65536)
+    ipfs_client.compact_documents = app.config.get("COMPACT_COURSE_STORAGE", False)
+
     blockchain.difficulty = app.config.get("BLOCKCHAIN_DIFFICULTY", 0)
     blockchain.VALIDATORS = app.config.get("VALIDATOR_USERNAMES", ["admin", "issuer1"])
 
@@ -129,6 +150,12 @@ def create_app():
 
     init_extensions(app)
     register_blueprints(app)
+
+    # Pick up issuance jobs interrupted by a crash/restart (notifier is wired by the issuer blueprint)
+    issuance_pipeline.app = app
+    issuance_pipeline.resume()
+    # Background integrity sweeps back the verify_credential fast path
+    credential_manager.document_mirror.start()
     return app
 
 
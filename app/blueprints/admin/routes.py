@@ -27,6 +27,8 @@ from flask import (
     make_response,
     send_file,
     current_app,
+    Response,
+    stream_with_context,
 )
 import os, json, base64, hmac, hashlib, gzip, uuid
 from typing import Any
@@ -35,7 +37,17 @@ import secrets, string
 from app.models import db, User, BlockRecord
 from app.auth import login_required, role_required
 from core.logger import logging
-from app.app import crypto_manager, blockchain, credential_manager, ticket_manager, zkp_manager, ipfs_client, mailer
+from app.app import (
+    crypto_manager,
+    blockchain,
+    credential_manager,
+    registry_replay,
+    registry_analytics,
+    ticket_manager,
+    zkp_manager,
+    ipfs_client,
+    mailer,
+)
 from app.services.mail_service import generate_otp, get_masked_email
 
 admin_bp = Blueprint("admin", __name__)
@@ -147,7 +159,9 @@ def api_system_reset():
         db.session.commit()
 
         # 2. Gather Comprehensive Data for Report
-        all_creds = credential_manager.get_all_credentials()
+        all_creds = credential_manager.list_credentials(
+            page=None, fields=["student_name", "student_id", "degree", "status", "version"]
+        )["credentials"]
         all_students = User.query.filter_by(role="student").all()
         all_admins = User.query.filter_by(role="issuer").all()
         all_verifiers = User.query.filter_by(role="verifier").all()
@@ -356,7 +370,7 @@ def api_system_reset():
         create_default_users()
 
         # Clear in-memory
-        credential_manager.credentials_registry = {}
+        credential_manager.reset_registry()
         ticket_manager.tickets = {}
         ticket_manager.messages = {}
 
@@ -391,11 +405,9 @@ def api_system_stats():
 
         # Try to get real data
         try:
-            all_creds = credential_manager.get_all_credentials()
-            stats["credentials"]["total"] = len(all_creds)
-            stats["credentials"]["active"] = len([c for c in all_creds if c.get("status") == "active"])
-            stats["credentials"]["revoked"] = len([c for c in all_creds if c.get("status") == "revoked"])
-            stats["credentials"]["superseded"] = len([c for c in all_creds if c.get("status") == "superseded"])
+            counts = registry_analytics.status_counts()
+            for key in ("total", "active", "revoked", "superseded"):
+                stats["credentials"][key] = counts.get(key, 0)
         except Exception as e:
             logging.warning(f"Could not load credentials: {e}")
 
@@ -428,6 +440,7 @@ def api_system_stats():
             "node_name": current_app.config.get("NODE_ID") or os.environ.get("NODE_NAME", "standalone"),
             "validators": blockchain.VALIDATORS,
         }
+        stats["crypto"] = {"verify_cache": crypto_manager.verify_cache_info()}
 
         return jsonify({"success": True, "stats": stats})
 
@@ -436,6 +449,92 @@ def api_system_stats():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@admin_bp.route("/api/admin/registry/export", methods=["GET"])
+def api_registry_export():
+    """ADMIN ONLY: Stream the credential registry as NDJSON (?gzip=1 for a .ndjson.gz download)"""
+    if session.get("role") != "issuer":
+        return jsonify({"success": False, "error": "Unauthorized"}), 403
+
+    compress = request.args.get("gzip", "").lower() in ("1", "true")
+    status = request.args.get("status") or None
+    filename = f"credentials_registry_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}.ndjson" + (".gz" if compress else "")
+
+    response = Response(
+        stream_with_context(credential_manager.export_registry(compress=compress, status=status)),
+        mimetype="application/gzip" if compress else "application/x-ndjson",
+    )
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return response
+
+
+@admin_bp.route("/api/admin/registry/import", methods=["POST"])
+def api_registry_import():
+    """ADMIN ONLY: Bulk-import NDJSON registry rows (plain or gzip upload, or a raw NDJSON body)"""
+    if session.get("role") != "issuer":
+        return jsonify({"success": False, "error": "Unauthorized"}), 403
+
+    try:
+        uploaded = request.files.get("file")
+        overwrite = request.args.get("overwrite", "").lower() in ("1", "true")
+        batch_size = max(1, min(int(request.args.get("batch_size", 500)), 5000))
+
+        if uploaded:
+            source, compressed = uploaded.stream, None  # Spooled upload: gzip is sniffed from the magic bytes
+        else:
+            # Raw streamed body: read line by line, compression declared via headers
+            source = request.stream
+            compressed = request.mimetype == "application/gzip" or request.headers.get("Content-Encoding") == "gzip"
+
+        result = credential_manager.import_registry(
+            source, batch_size=batch_size, overwrite=overwrite, compressed=compressed
+        )
+        return jsonify(result), 200 if result["success"] else 500
+    except Exception as e:
+        logging.error(f"Registry import error: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@admin_bp.route("/api/admin/registry/replay", methods=["GET", "POST"])
+def api_registry_replay():
+    """ADMIN ONLY: Replay the chain and diff it against the registry (POST with apply=true repairs drift)"""
+    if session.get("role") != "issuer":
+        return jsonify({"success": False, "error": "Unauthorized"}), 403
+
+    try:
+        payload = request.get_json(silent=True) or {}
+        verify_documents = str(request.args.get("verify_documents", payload.get("verify_documents", "1"))).lower()
+        apply = request.method == "POST" and str(payload.get("apply", request.args.get("apply", ""))).lower() in (
+            "1",
+            "true",
+        )
+
+        result = registry_replay.run(verify_documents=verify_documents not in ("0", "false"), apply=apply)
+        return jsonify(result), 200 if result["success"] else 500
+    except Exception as e:
+        logging.error(f"Registry replay error: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@admin_bp.route("/api/admin/analytics", methods=["GET"])
+def api_registry_analytics():
+    """ADMIN ONLY: Cohort analytics (CGPA distribution, backlog rates) grouped by department/batch/year/status"""
+    if session.get("role") != "issuer":
+        return jsonify({"success": False, "error": "Unauthorized"}), 403
+
+    try:
+        by = request.args.get("by", "department")
+        status = request.args.get("status") or None
+        bins = request.args.get("bins", 10, type=int)
+        if by not in registry_analytics.snapshot().codes:
+            return jsonify({"success": False, "error": f"Unsupported group-by: {by}"}), 400
+
+        result = registry_analytics.group_by(by=by, status=status, bins=bins)
+        return jsonify({"success": True, "status_counts": registry_analytics.status_counts(), **result})
+    except Exception as e:
+        logging.error(f"Registry analytics error: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 @admin_bp.route("/api/admin/onboarding_status", methods=["GET"])
 def api_onboarding_status():
     """Get onboarding and activation status for all students"""
@@ -59,6 +59,13 @@ def tutorial():
     return render_template("tutorial.html")
 
 
+@api_bp.route("/api/ready", methods=["GET"])
+def api_ready():
+    """Readiness probe: 503 until the issuer keys are provisioned (liveness does not wait on them)"""
+    ready = crypto_manager.is_ready
+    return jsonify({"ready": ready, "issuer_keys": "ready" if ready else "provisioning"}), 200 if ready else 503
+
+
 @api_bp.route("/blockchain/chain", methods=["GET"])
 def get_full_chain():
     """Return the entire blockchain for peer synchronization"""
@@ -202,7 +209,7 @@ def api_blockchain_status():
     try:
         status = {
             "total_blocks": len(blockchain.chain),
-            "total_credentials": len(credential_manager.get_all_credentials()),
+            "total_credentials": credential_manager.count_credentials_by_status()["total"],
             "last_block_hash": blockchain.get_latest_block().hash if blockchain.chain else None,
             "ipfs_status": ipfs_client.is_connected(),
         }
@@ -260,6 +267,23 @@ def api_get_credential(credential_id):
         return jsonify({"error": str(e)}), 500
 
 
+@api_bp.route("/api/status/list", methods=["GET"])
+def api_status_list():
+    """Signed, gzip-compressed revocation bitstring (StatusList2021 style) for offline/bulk status checks"""
+    try:
+        list_credential, etag = credential_manager.status_list.publish()
+        if etag in request.if_none_match:
+            response = make_response("", 304)
+        else:
+            response = make_response(jsonify(list_credential))
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "public, max-age=300, must-revalidate"
+        return response
+    except Exception as e:
+        logging.error(f"Error publishing status list: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+
 @api_bp.route("/api/public/issuers", methods=["GET"])
 def api_public_issuer_registry():
     """Expose trusted issuer public keys for offline-capable scanner apps."""
@@ -268,12 +292,15 @@ def api_public_issuer_registry():
         return jsonify(
             {
                 "success": True,
-                "version": 1,
+                "version": 2,
                 "issuers": {
                     issuer_id: {
                         "name": "GPREC",
+                        # Legacy single-key fields (RSA) for older scanner builds
                         "algorithm": "PS256",
                         "publicKeyPem": crypto_manager.get_public_key_pem(),
+                        "activeKid": crypto_manager.active_kid,
+                        "keys": crypto_manager.get_public_keys(),
                     }
                 },
             }
@@ -293,6 +320,10 @@ def api_qr_secret_verify():
         qr_data = (data.get("qd") or "").strip()
         credential_id = (data.get("credential_id") or "").strip()
 
+        # Scraped/fake IDs are rejected before any token decoding or verification work
+        if credential_id and not credential_manager.credential_exists(credential_id):
+            return jsonify({"success": False, "status": "fake", "error": "Unknown credential"}), 404
+
         payload = _verify_qr_secret_token(token, expected_cid=credential_id or None, expected_qd=qr_data or None)
         if not payload:
             return jsonify({"success": False, "status": "fake", "error": "Invalid or tampered QR secret token"}), 400
@@ -34,8 +34,18 @@ import secrets, string
 from app.models import db, User, BlockRecord
 from app.auth import login_required, role_required
 from core.logger import logging
-from app.app import crypto_manager, blockchain, credential_manager, ticket_manager, zkp_manager, ipfs_client, mailer
+from app.app import (
+    crypto_manager,
+    blockchain,
+    credential_manager,
+    ticket_manager,
+    zkp_manager,
+    ipfs_client,
+    mailer,
+    issuance_pipeline,
+)
 from app.services.mail_service import generate_otp, get_masked_email
+from app.services.idempotency import idempotent
 
 issuer_bp = Blueprint("issuer", __name__)
 
@@ -52,167 +62,128 @@ def issuer():
     return handle_login_request(portal_role="issuer")
 
 
+def _build_transcript_data(data):
+    """Validate and normalize an issuance request body -> (transcript_data, None) or (None, error message)"""
+
+    def _split_list(value):
+        """Normalize comma/newline separated values into a clean list."""
+        if value is None:
+            return []
+        if isinstance(value, list):
+            items = value
+        else:
+            text = str(value).replace("\\n", ",")
+            items = text.split(",")
+        return [str(item).strip() for item in items if str(item).strip()]
+
+    def _is_empty_backlog_token(token):
+        return token.strip().upper() in {"N/A", "NIL", "NILL", "NONE", "0", "O", ""}
+
+    # Core required fields
+    required_fields = [
+        "student_name",
+        "student_id",
+        "degree",
+        "department",
+        "student_status",
+        "college",
+        "university",
+        "issue_date",
+    ]
+    for field in required_fields:
+        if field not in data or data[field] is None or data[field] == "":
+            return None, f"Missing required field: {field}"
+
+    # Additional validations
+    if data.get("student_status") == "graduated" and not data.get("graduation_year"):
+        return None, "Graduation year is required for graduated students"
+
+    cgpa = data.get("cgpa")
+    if cgpa is not None:
+        try:
+            cgpa = float(cgpa)
+        except ValueError:
+            return None, "CGPA must be a valid number"
+        if cgpa < 0 or cgpa > 10:
+            return None, "CGPA must be between 0.00 and 10.00"
+
+    raw_backlogs = _split_list(data.get("backlogs", []))
+    clean_backlogs = [c for c in raw_backlogs if not _is_empty_backlog_token(c)]
+    raw_courses = _split_list(data.get("courses", []))
+    clean_courses = [c for c in raw_courses if str(c).strip().upper() not in ["N/A", "NILL", "NIL", "NONE", ""]]
+
+    backlog_count_val = int(data.get("backlog_count") or 0)
+    if backlog_count_val < 0:
+        backlog_count_val = 0
+    if clean_backlogs:
+        backlog_count_val = len(clean_backlogs)
+
+    grad_year = data.get("graduation_year")
+    if not grad_year and data.get("batch") and "-" in data.get("batch"):
+        grad_year = data.get("batch").split("-")[1].strip()
+
+    # For pursuing students, derive expected graduation year from batch to avoid null/N/A in certificates.
+    if data.get("student_status") == "pursuing" and not grad_year and data.get("batch") and "-" in data.get("batch"):
+        grad_year = data.get("batch").split("-")[1].strip()
+
+    # Build extended transcript data
+    transcript_data = {
+        "student_name": data["student_name"].strip(),
+        "student_id": data["student_id"].strip().upper(),
+        "degree": data["degree"],
+        "department": data["department"],
+        "student_status": data["student_status"],
+        "semester": data.get("semester"),
+        "year": data.get("year"),
+        "graduation_year": grad_year,
+        "batch": data.get("batch"),
+        "section": data.get("section"),
+        "college": data.get("college"),
+        "university": data.get("university"),
+        "cgpa": cgpa,
+        "gpa": cgpa,  # Backward compatibility
+        "conduct": data.get("conduct", "N/A"),
+        "backlog_count": backlog_count_val,
+        "courses": clean_courses,
+        "backlogs": clean_backlogs,
+        "issued_by": data.get("issued_by", "G. Pulla Reddy Engineering College"),
+        "issue_date": data["issue_date"],
+        "issuer": data.get("issued_by", "G. Pulla Reddy Engineering College"),  # Backward compatibility
+    }
+    return transcript_data, None
+
+
 @issuer_bp.route("/api/issue_credential", methods=["POST"])
+@idempotent
 def api_issue_credential():
     try:
         data = request.get_json()
 
-        def _split_list(value):
-            """Normalize comma/newline separated values into a clean list."""
-            if value is None:
-                return []
-            if isinstance(value, list):
-                items = value
-            else:
-                text = str(value).replace("\\n", ",")
-                items = text.split(",")
-            return [str(item).strip() for item in items if str(item).strip()]
-
-        def _is_empty_backlog_token(token):
-            return token.strip().upper() in {"N/A", "NIL", "NILL", "NONE", "0", "O", ""}
-
-        # Core required fields
-        required_fields = [
-            "student_name",
-            "student_id",
-            "degree",
-            "department",
-            "student_status",
-            "college",
-            "university",
-            "issue_date",
-        ]
-        for field in required_fields:
-            if field not in data or data[field] is None or data[field] == "":
-                return jsonify({"error": f"Missing required field: {field}"}), 400
-
-        # Additional validations
-        if data.get("student_status") == "graduated" and not data.get("graduation_year"):
-            return jsonify({"error": "Graduation year is required for graduated students"}), 400
-
-        cgpa = data.get("cgpa")
-        if cgpa is not None:
-            try:
-                cgpa = float(cgpa)
-            except ValueError:
-                return jsonify({"error": "CGPA must be a valid number"}), 400
-            if cgpa < 0 or cgpa > 10:
-                return jsonify({"error": "CGPA must be between 0.00 and 10.00"}), 400
-
-        raw_backlogs = _split_list(data.get("backlogs", []))
-        clean_backlogs = [c for c in raw_backlogs if not _is_empty_backlog_token(c)]
-        raw_courses = _split_list(data.get("courses", []))
-        clean_courses = [c for c in raw_courses if str(c).strip().upper() not in ["N/A", "NILL", "NIL", "NONE", ""]]
-
-        backlog_count_val = int(data.get("backlog_count") or 0)
-        if backlog_count_val < 0:
-            backlog_count_val = 0
-        if clean_backlogs:
-            backlog_count_val = len(clean_backlogs)
-
-        grad_year = data.get("graduation_year")
-        if not grad_year and data.get("batch") and "-" in data.get("batch"):
-            grad_year = data.get("batch").split("-")[1].strip()
-
-        # For pursuing students, derive expected graduation year from batch to avoid null/N/A in certificates.
-        if (
-            data.get("student_status") == "pursuing"
-            and not grad_year
-            and data.get("batch")
-            and "-" in data.get("batch")
-        ):
-            grad_year = data.get("batch").split("-")[1].strip()
-
-        # Build extended transcript data
-        transcript_data = {
-            "student_name": data["student_name"].strip(),
-            "student_id": data["student_id"].strip().upper(),
-            "degree": data["degree"],
-            "department": data["department"],
-            "student_status": data["student_status"],
-            "semester": data.get("semester"),
-            "year": data.get("year"),
-            "graduation_year": grad_year,
-            "batch": data.get("batch"),
-            "section": data.get("section"),
-            "college": data.get("college"),
-            "university": data.get("university"),
-            "cgpa": cgpa,
-            "gpa": cgpa,  # Backward compatibility
-            "conduct": data.get("conduct", "N/A"),
-            "backlog_count": backlog_count_val,
-            "courses": clean_courses,
-            "backlogs": clean_backlogs,
-            "issued_by": data.get("issued_by", "G. Pulla Reddy Engineering College"),
-            "issue_date": data["issue_date"],
-            "issuer": data.get("issued_by", "G. Pulla Reddy Engineering College"),  # Backward compatibility
-        }
+        transcript_data, error = _build_transcript_data(data)
+        if error:
+            return jsonify({"error": error}), 400
 
         logging.info(f"Issuing credential with data: status={data['student_status']}, department={data['department']}")
 
+        # ASYNC MODE: queue through the staged pipeline and return a job id to poll
+        if data.get("async") or request.args.get("async") in ("1", "true"):
+            job_id = issuance_pipeline.submit(transcript_data, metadata={"email": data.get("email")})
+            return (
+                jsonify(
+                    {
+                        "success": True,
+                        "job_id": job_id,
+                        "status": "queued",
+                        "status_url": url_for("issuer.api_issuance_job_status", job_id=job_id),
+                    }
+                ),
+                202,
+            )
+
         result = credential_manager.issue_credential(transcript_data)
 
         if result["success"]:
-            try:
-                student_name = transcript_data["student_name"]
-                student_id_val = str(transcript_data["student_id"])
-                student_email = data.get("email")
-
-                # UNIFORM ONBOARDING: Create student user in 'pending' state
-                student_user = User.query.filter_by(student_id=student_id_val).first()
-                activation_token = str(uuid.uuid4())
-
-                if student_user:
-                    student_user.full_name = student_name
-                    student_user.email = student_email
-                    student_user.activation_token = activation_token
-                    student_user.onboarding_status = "pending"
-                    db.session.commit()
-                else:
-                    new_student = User(
-                        username=f"user_{student_id_val}",
-                        role="student",
-                        student_id=student_id_val,
-                        full_name=student_name,
-                        email=student_email,
-                        onboarding_status="pending",
-                        activation_token=activation_token,
-                        is_verified=False,
-                    )
-                    # Temporary safe password until setup
-                    new_student.set_password(str(uuid.uuid4()))
-                    db.session.add(new_student)
-                    db.session.commit()
-
-                # TRIGGER FIRST ONBOARDING EMAIL WITH FULL DETAILS (ASYNCHRONOUS)
-                if student_email:
-                    import threading
-
-                    app_obj = current_app._get_current_object()
-
-                    def send_async():
-                        with app_obj.app_context():
-                            try:
-                                sent = mailer.send_onboarding_mail(
-                                    student_email,
-                                    student_name,
-                                    activation_token,
-                                    transcript_data["degree"],
-                                    transcript_data.get("cgpa"),
-                                    transcript_data.get("graduation_year", "N/A"),
-                                )
-                                if sent:
-                                    logging.info(f"Detailed onboarding mail sent to {student_email}")
-                                else:
-                                    logging.error(f"Onboarding mail delivery failed for {student_email}")
-                            except Exception as em:
-                                logging.error(f"Async mail error: {em}")
-
-                    threading.Thread(target=send_async, daemon=True).start()
-
-            except Exception as e:
-                logging.error(f"Error in onboarding workflow: {str(e)}")
-
+            _onboard_student(transcript_data, data.get("email"))
             flash("Credential issued successfully. Student notification has been queued for delivery.", "success")
             return jsonify(result)
         else:
@@ -223,7 +194,155 @@ def api_issue_credential():
         return jsonify({"error": str(e)}), 500
 
 
+@issuer_bp.route("/api/issue_credentials/batch", methods=["POST"])
+@idempotent
+def api_issue_credentials_batch():
+    """Issue a whole batch of transcripts under one signature (Merkle root of the credential hashes) and one block"""
+    try:
+        data = request.get_json() or {}
+        items = data.get("transcripts")
+        if not isinstance(items, list) or not items:
+            return jsonify({"success": False, "error": "transcripts must be a non-empty list"}), 400
+
+        results = [None] * len(items)
+        valid = []  # (position, transcript_data, email)
+        for position, item in enumerate(items):
+            transcript_data, error = _build_transcript_data(item if isinstance(item, dict) else {})
+            if error:
+                results[position] = {"success": False, "error": error}
+            else:
+                valid.append((position, transcript_data, item.get("email")))
+
+        if valid:
+            result = credential_manager.issue_credentials_batch([transcript for _, transcript, _ in valid])
+            if "results" not in result:
+                return jsonify(result), 400
+            for (position, _, _), item_result in zip(valid, result["results"]):
+                results[position] = item_result
+
+            # NOTIFICATION: onboard every issued student from one background thread
+            issued = [
+                (transcript, email)
+                for (_, transcript, email), item_result in zip(valid, result["results"])
+                if item_result["success"]
+            ]
+            if issued:
+                import threading
+
+                app_obj = current_app._get_current_object()
+
+                def onboard_async():
+                    with app_obj.app_context():
+                        for transcript, email in issued:
+                            _onboard_student(transcript, email, send_mail_async=False)
+
+                threading.Thread(target=onboard_async, daemon=True).start()
+
+        issued_count = sum(1 for item_result in results if item_result["success"])
+        return jsonify(
+            {
+                "success": issued_count > 0,
+                "issued": issued_count,
+                "failed": len(results) - issued_count,
+                "results": results,
+            }
+        )
+
+    except Exception as e:
+        logging.error(f"Error batch issuing credentials: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+def _onboard_student(transcript_data, student_email, send_mail_async=True):
+    """Upsert the pending student account and send the onboarding mail for a freshly issued credential"""
+    try:
+        student_name = transcript_data["student_name"]
+        student_id_val = str(transcript_data["student_id"])
+
+        # UNIFORM ONBOARDING: Create student user in 'pending' state
+        student_user = User.query.filter_by(student_id=student_id_val).first()
+        activation_token = str(uuid.uuid4())
+
+        if student_user:
+            student_user.full_name = student_name
+            student_user.email = student_email
+            student_user.activation_token = activation_token
+            student_user.onboarding_status = "pending"
+            db.session.commit()
+        else:
+            new_student = User(
+                username=f"user_{student_id_val}",
+                role="student",
+                student_id=student_id_val,
+                full_name=student_name,
+                email=student_email,
+                onboarding_status="pending",
+                activation_token=activation_token,
+                is_verified=False,
+            )
+            # Temporary safe password until setup
+            new_student.set_password(str(uuid.uuid4()))
+            db.session.add(new_student)
+            db.session.commit()
+
+        # TRIGGER FIRST ONBOARDING EMAIL WITH FULL DETAILS
+        if student_email:
+
+            def send_mail():
+                try:
+                    sent = mailer.send_onboarding_mail(
+                        student_email,
+                        student_name,
+                        activation_token,
+                        transcript_data["degree"],
+                        transcript_data.get("cgpa"),
+                        transcript_data.get("graduation_year", "N/A"),
+                    )
+                    if sent:
+                        logging.info(f"Detailed onboarding mail sent to {student_email}")
+                    else:
+                        logging.error(f"Onboarding mail delivery failed for {student_email}")
+                except Exception as em:
+                    logging.error(f"Async mail error: {em}")
+
+            if send_mail_async:
+                import threading
+
+                app_obj = current_app._get_current_object()
+
+                def send_async():
+                    with app_obj.app_context():
+                        send_mail()
+
+                threading.Thread(target=send_async, daemon=True).start()
+            else:
+                send_mail()
+
+    except Exception as e:
+        logging.error(f"Error in onboarding workflow: {str(e)}")
+
+
+def _notify_issued_student(job):
+    """Notify stage of the issuance pipeline (runs in a pipeline worker, already inside an app context)"""
+    result = job.get("result") or {}
+    if result.get("success"):
+        _onboard_student(job["issuance"]["transcript_data"], job["metadata"].get("email"), send_mail_async=False)
+
+
+issuance_pipeline.notifier = _notify_issued_student
+
+
+@issuer_bp.route("/api/issue_credential/jobs/<job_id>", methods=["GET"])
+def api_issuance_job_status(job_id):
+    """Status of an asynchronous issuance job"""
+    job = issuance_pipeline.get_job(job_id)
+    if not job:
+        return jsonify({"success": False, "error": "Job not found"}), 404
+    return jsonify({"success": True, "job": job})
+
+
 @issuer_bp.route("/api/revoke_credential", methods=["POST"])
+@idempotent
 def api_revoke_credential():
     """Revoke a credential (blockchain-compliant - no deletion)"""
     try:
@@ -237,7 +356,7 @@ def api_revoke_credential():
 
         valid_categories = ["duplicate", "misconduct", "legal", "request", "other"]
         if reason_category not in valid_categories:
-            return jsonify({"success": False, "error": f"Invalid reason_category"}), 400
+            return jsonify({"success": False, "error": "Invalid reason_category"}), 400
 
         result = credential_manager.revoke_credential(credential_id, reason, reason_category)
 
@@ -257,7 +376,69 @@ def api_revoke_credential():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def _send_revocation_mails(revoked, reason):
+    """Queue revocation notices for a batch: one user lookup, mails sent from a single background thread"""
+    student_ids = {item["student_id"] for item in revoked if item.get("student_id")}
+    if not student_ids:
+        return
+    emails = {
+        user.student_id: user.email for user in User.query.filter(User.student_id.in_(student_ids)).all() if user.email
+    }
+    outbox = [
+        (emails[item["student_id"]], item.get("degree") or "Academic Transcript")
+        for item in revoked
+        if item.get("student_id") in emails
+    ]
+    if not outbox:
+        return
+
+    import threading
+
+    app_obj = current_app._get_current_object()
+
+    def send_async():
+        with app_obj.app_context():
+            for email, degree in outbox:
+                try:
+                    mailer.send_revocation_mail(email, degree, reason)
+                except Exception as em:
+                    logging.error(f"Revocation mail error: {em}")
+
+    threading.Thread(target=send_async, daemon=True).start()
+
+
+@issuer_bp.route("/api/revoke_credentials/batch", methods=["POST"])
+@idempotent
+def api_revoke_credentials_batch():
+    """Revoke many credentials in one revocation block (e.g. after a grading error across a batch)"""
+    try:
+        data = request.get_json() or {}
+        credential_ids = data.get("credential_ids")
+        reason = data.get("reason", "")
+        reason_category = data.get("reason_category", "other")
+
+        if not isinstance(credential_ids, list) or not credential_ids:
+            return jsonify({"success": False, "error": "credential_ids must be a non-empty list"}), 400
+
+        valid_categories = ["duplicate", "misconduct", "legal", "request", "other"]
+        if reason_category not in valid_categories:
+            return jsonify({"success": False, "error": "Invalid reason_category"}), 400
+
+        result = credential_manager.revoke_credentials_batch(credential_ids, reason, reason_category)
+
+        if result["success"]:
+            # NOTIFICATION: Notify every affected student in bulk
+            _send_revocation_mails([item for item in result["results"] if item["success"]], reason)
+
+        return jsonify(result), 200 if result["success"] or "results" in result else 400
+
+    except Exception as e:
+        logging.error(f"Error batch revoking credentials: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 @issuer_bp.route("/api/create_new_version", methods=["POST"])
+@idempotent
 def api_create_new_version():
     """Create a new version of a credential (for corrections/updates)"""
     try:
@@ -321,7 +502,11 @@ def api_create_new_version():
 def api_credential_history(student_id):
     """Get complete credential history for a student (all versions)"""
     try:
-        result = credential_manager.get_credential_history(student_id)
+        result = credential_manager.get_credential_history(
+            student_id,
+            page=request.args.get("page", type=int),
+            per_page=request.args.get("per_page", 20, type=int),
+        )
         return jsonify(result)
     except Exception as e:
         logging.error(f"Error getting credential history: {str(e)}")
@@ -330,9 +515,21 @@ def api_credential_history(student_id):
 
 @issuer_bp.route("/api/credentials", methods=["GET"])
 def api_credentials():
+    """
+    Registry listing. Optional query params: page, per_page, status,
+    fields (comma separated projection) and include=documents to attach IPFS bodies.
+    """
     try:
-        creds = credential_manager.get_all_credentials()
-        return jsonify({"success": True, "credentials": creds})
+        page = request.args.get("page", type=int)
+        fields = [f.strip() for f in (request.args.get("fields") or "").split(",") if f.strip()]
+        result = credential_manager.list_credentials(
+            page=page,
+            per_page=request.args.get("per_page", 50, type=int),
+            fields=fields or None,
+            status=request.args.get("status") or None,
+            include_documents=request.args.get("include") == "documents",
+        )
+        return jsonify(result)
     except Exception as e:
         logging.error(f"Error listing credentials: {str(e)}")
         return jsonify({"success": False, "error": str(e)}), 500
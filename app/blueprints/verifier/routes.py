@@ -26,6 +26,8 @@ from flask import (
     session,
     make_response,
     send_file,
+    Response,
+    stream_with_context,
 )
 import os, json, base64, hmac, hashlib, gzip, uuid, re
 from datetime import datetime, timedelta
@@ -168,18 +170,7 @@ def api_verify_credential():
 
         #  PRIVACY PROTECTION: Strip sensitive data if in privacy_mode
         if privacy_mode and result.get("valid"):
-            # Only return essential proof info, not the actual student data
-            stripped_result = {
-                "valid": result["valid"],
-                "status": result["status"],
-                "verification_details": result.get("verification_details"),
-                "registry_entry": {
-                    "issuer_id": result["registry_entry"].get("issuer_id"),
-                    "issue_date": result["registry_entry"].get("issue_date"),
-                    "status": result["registry_entry"].get("status"),
-                },
-            }
-            return jsonify(stripped_result)
+            return jsonify(_strip_verification_result(result))
 
         return jsonify(result)
     except Exception as e:
@@ -187,6 +178,86 @@ def api_verify_credential():
         return jsonify({"error": str(e)}), 500
 
 
+def _strip_verification_result(result):
+    """Only return essential proof info, not the actual student data"""
+    return {
+        "valid": result["valid"],
+        "status": result["status"],
+        "verification_details": result.get("verification_details"),
+        "registry_entry": {
+            "issuer_id": result["registry_entry"].get("issuer_id"),
+            "issue_date": result["registry_entry"].get("issue_date"),
+            "status": result["registry_entry"].get("status"),
+        },
+    }
+
+
+MAX_BATCH_VERIFY = 1000
+
+
+def _read_batch_credential_ids():
+    """Collect credential IDs from a JSON list or an uploaded CSV (credential_id column or first column)."""
+    data = request.get_json(silent=True) or {}
+    credential_ids = data.get("credential_ids") or []
+    if isinstance(credential_ids, str):
+        credential_ids = re.split(r"[\s,]+", credential_ids)
+
+    uploaded = request.files.get("file") or request.files.get("csv") if request.files else None
+    if uploaded:
+        import csv
+        import io
+
+        text = (uploaded.read() or b"").decode("utf-8-sig", errors="ignore")
+        rows = list(csv.reader(io.StringIO(text)))
+        column = 0
+        if rows:
+            header = [str(cell).strip().lower() for cell in rows[0]]
+            if "credential_id" in header:
+                column = header.index("credential_id")
+                rows = rows[1:]
+            elif rows[0] and not re.search(r"[0-9a-fA-F]{8}-", rows[0][0]):
+                rows = rows[1:]  # Unknown header row
+        credential_ids = list(credential_ids) + [row[column] for row in rows if len(row) > column]
+
+    return [str(cid).strip() for cid in credential_ids if str(cid).strip()]
+
+
+@verifier_bp.route("/api/verify_credentials/batch", methods=["POST"])
+def api_verify_credentials_batch():
+    """
+    Bulk verification for employers: accepts {"credential_ids": [...]} or an uploaded CSV.
+    Streams one NDJSON line per credential as soon as its verification completes,
+    followed by a summary line.
+    """
+    try:
+        credential_ids = _read_batch_credential_ids()
+        privacy_mode = bool((request.get_json(silent=True) or {}).get("privacy_mode", False)) or (
+            request.form.get("privacy_mode", "").lower() in {"1", "true", "yes"}
+        )
+
+        if not credential_ids:
+            return jsonify({"error": "At least one credential ID is required"}), 400
+        if len(credential_ids) > MAX_BATCH_VERIFY:
+            return jsonify({"error": f"Batch limited to {MAX_BATCH_VERIFY} credentials per request"}), 400
+
+        def generate():
+            total = 0
+            valid = 0
+            for credential_id, result in credential_manager.verify_credentials_batch(credential_ids):
+                total += 1
+                if result.get("valid"):
+                    valid += 1
+                    if privacy_mode:
+                        result = _strip_verification_result(result)
+                yield json.dumps({"credential_id": credential_id, "result": result}, default=str) + "\n"
+            yield json.dumps({"summary": {"total": total, "valid": valid, "invalid": total - valid}}) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+    except Exception as e:
+        logging.error(f"Error in batch verification: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+
 @verifier_bp.route("/api/verify_blind_disclosure", methods=["POST"])
 def api_verify_blind_disclosure():
     """
@@ -250,7 +321,7 @@ def api_verify_zkp():
             if suffix:
                 matches = [
                     c.get("credential_id")
-                    for c in credential_manager.get_all_credentials()
+                    for c in credential_manager.list_credentials(page=None, fields=["credential_id"])["credentials"]
                     if str(c.get("credential_id", "")).endswith(suffix)
                 ]
                 if len(matches) == 1:
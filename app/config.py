@@ -72,10 +72,21 @@ class Config:
 
     # Crypto settings - FIXED path
     KEY_FILE = DATA_DIR / "issuer_keys.pem"
+    KEYRING_FILE = DATA_DIR / "issuer_keyring.json"
+    # Algorithm for new signatures: PS256 (RSA-4096, what existing scanners verify), or opt in to EdDSA (Ed25519)
+    # or ES256 (ECDSA P-256) once every scanner reads the kid-tagged keys from /api/public/issuers
+    SIGNING_ALGORITHM = os.environ.get("SIGNING_ALGORITHM", "PS256")
+    # Signing worker processes: -1 = one per core while the RSA key is active, 0 = sign in-process
+    SIGNING_WORKERS = int(os.environ.get("SIGNING_WORKERS", "-1"))
+    # Verified (key, message, signature) triples remembered by CryptoManager (positive results only)
+    VERIFY_CACHE_SIZE = int(os.environ.get("VERIFY_CACHE_SIZE", "65536"))
 
     # Storage settings - FIXED paths
     CREDENTIALS_FILE = DATA_DIR / "credentials_registry.json"
     IPFS_STORAGE_FILE = DATA_DIR / "ipfs_storage.json"
+    # Store course/backlog lists in local documents as course catalog ids (expanded on read).
+    # Off by default: compacted documents cannot be read back without data/course_catalog.json
+    COMPACT_COURSE_STORAGE = os.environ.get("COMPACT_COURSE_STORAGE", "False").lower() == "true"
 
     # University settings
     UNIVERSITY_NAME = "G. Pulla Reddy Engineering College"
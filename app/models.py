@@ -242,6 +242,22 @@ class BlockRecord(db.Model):
         return f"<Block {self.index}: {self.hash[:10]}>"
 
 
+class DisclosureRecord(db.Model):
+    """SQL model for blind selective disclosures, shared by every worker process"""
+
+    __tablename__ = "disclosures"
+
+    id = db.Column(db.Integer, primary_key=True)
+    disclosure_id = db.Column(db.String(64), unique=True, nullable=False, index=True)
+    original_id = db.Column(db.String(100), nullable=False)
+    verifier = db.Column(db.String(255))
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<Disclosure {self.disclosure_id[:10]} -> {self.expires_at}>"
+
+
 def init_database(app):
     """Initialize database with app context"""
     # Configure database URL
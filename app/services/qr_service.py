@@ -21,11 +21,23 @@ import base64
 import hmac
 import hashlib
 import gzip
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
 from flask import current_app as app, url_for
 from app.app import crypto_manager, credential_manager
 
+# Scanners reject a QR 48 hours after its `gt` timestamp. A signed token is reused for at most
+# QR_TOKEN_REUSE_SECONDS, so every QR handed out still has at least 47 hours of validity left.
+QR_TOKEN_TTL_SECONDS = 48 * 3600
+QR_TOKEN_REUSE_SECONDS = 3600
+QR_TOKEN_CACHE_SIZE = 4096
+
+# (credential_id, registry revision, hidden payload on/off) -> {"qr_token", "qr_data", "generated_at"}
+_qr_token_cache = OrderedDict()
+_qr_token_lock = threading.Lock()
+
 
 def _qr_signing_key():
     """Derive a stable signing key for QR secret payloads."""
@@ -149,14 +161,47 @@ def _hash_qr_hidden_payload(qr_data):
     return hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
 
 
-def _build_verify_url(credential_id):
-    """Build the canonical verify URL used by all QR generation paths."""
-    include_hidden_payload = os.environ.get("QR_INCLUDE_HIDDEN_PAYLOAD", "false").lower() == "true"
+def _cached_qr_token(credential_id, include_hidden_payload):
+    """Signed QR token (and hidden payload), re-signed only when the registry entry changes or the reuse window ends."""
+    revision = credential_manager.registry_revision(credential_id)
+    key = (str(credential_id), revision, include_hidden_payload)
+    now = int(datetime.utcnow().timestamp())
+
+    if revision is not None:
+        with _qr_token_lock:
+            cached = _qr_token_cache.get(key)
+            if cached and 0 <= now - cached["generated_at"] < QR_TOKEN_REUSE_SECONDS:
+                _qr_token_cache.move_to_end(key)
+                return cached
+
     qr_data = _generate_qr_hidden_payload(credential_id) if include_hidden_payload else None
     qr_token = _generate_qr_secret_token(
         credential_id,
         _hash_qr_hidden_payload(qr_data) if qr_data else None,
     )
+    entry = {"qr_token": qr_token, "qr_data": qr_data, "generated_at": now}
+
+    # Unknown credentials are not cached, so a later issuance is picked up immediately.
+    if revision is not None:
+        with _qr_token_lock:
+            _qr_token_cache[key] = entry
+            _qr_token_cache.move_to_end(key)
+            while len(_qr_token_cache) > QR_TOKEN_CACHE_SIZE:
+                _qr_token_cache.popitem(last=False)
+    return entry
+
+
+def _clear_qr_token_cache():
+    with _qr_token_lock:
+        _qr_token_cache.clear()
+
+
+def _build_verify_url(credential_id):
+    """Build the canonical verify URL used by all QR generation paths."""
+    include_hidden_payload = os.environ.get("QR_INCLUDE_HIDDEN_PAYLOAD", "false").lower() == "true"
+    cached = _cached_qr_token(credential_id, include_hidden_payload)
+    qr_token = cached["qr_token"]
+    qr_data = cached["qr_data"]
 
     # Alternate compact mode: local verify page by default for shorter and more scanner-friendly URLs.
     verifier_base_url = (os.environ.get("QR_VERIFIER_BASE_URL") or "").strip()
@@ -166,8 +211,8 @@ def _build_verify_url(credential_id):
     parsed = urlsplit(verifier_base_url)
     existing_query = dict(parse_qsl(parsed.query, keep_blank_values=True))
 
-    # Add timestamp (Unix seconds) for 48-hour expiry validation
-    generated_at = int(datetime.utcnow().timestamp())
+    # Timestamp (Unix seconds) for 48-hour expiry validation; matches the token's signing time
+    generated_at = cached["generated_at"]
 
     existing_query.update(
         {
@@ -24,6 +24,7 @@ from pathlib import Path
 
 # FIXED: Import DATA_DIR from core package [web:42]
 from . import DATA_DIR, PROJECT_ROOT  # [web:42]
+from .merkle import MerkleTree
 
 logging.basicConfig(level=logging.INFO)
 
@@ -58,22 +59,10 @@ class Block:
         else:
             items = [str(self.data)]
 
-        # Trivial Merkle implementation if not using complex library
         if not items:
             return hashlib.sha256(b"empty").hexdigest()
 
-        hashes = [hashlib.sha256(item.encode()).hexdigest() for item in items]
-
-        while len(hashes) > 1:
-            if len(hashes) % 2 != 0:
-                hashes.append(hashes[-1])
-            new_hashes = []
-            for i in range(0, len(hashes), 2):
-                combined = hashes[i] + hashes[i + 1]
-                new_hashes.append(hashlib.sha256(combined.encode()).hexdigest())
-            hashes = new_hashes
-
-        return hashes[0]
+        return MerkleTree.from_items(item.encode() for item in items).root_hex
 
     def calculate_hash(self):
         """Calculate the hash of the block header and data"""
@@ -606,8 +595,12 @@ class SimpleBlockchain:
         return credential_blocks
 
     def find_credential_block(self, credential_id):
-        """Find a specific credential block by ID"""
+        """Find a specific credential block by ID (batch blocks list their credentials under credential_ids)"""
         for block in self.chain:
-            if isinstance(block.data, dict) and block.data.get("credential_id") == credential_id:
+            if not isinstance(block.data, dict):
+                continue
+            if block.data.get("credential_id") == credential_id or credential_id in block.data.get(
+                "credential_ids", ()
+            ):
                 return block
         return None
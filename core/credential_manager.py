@@ -15,15 +15,26 @@
 # ║  Unauthorized use carries legal consequences.           ║
 # ╚══════════════════════════════════════════════════════════╝
 
+import os
 import json
 import uuid
 import secrets
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
-import hashlib
+import gzip
+import threading
+import zlib
 
 from . import DATA_DIR, PROJECT_ROOT
+from .search_index import CredentialSearchIndex
+from .version_index import CredentialVersionIndex
+from .existence_filter import CredentialExistenceFilter
+from .disclosure_store import DisclosureStore
+from .canonical import CanonicalDocument
+from .status_list import StatusList
+from .document_mirror import DocumentMirror
+from .course_catalog import CourseCatalog
 
 logging.basicConfig(level=logging.INFO)
 
@@ -31,61 +42,131 @@ logging.basicConfig(level=logging.INFO)
 class CredentialManager:
     """Manages verifiable credentials using blockchain and IPFS with complete versioning support"""
 
-    def __init__(self, blockchain, crypto_manager, ipfs_client):
+    # Bound on in-process field Merkle trees kept for selective disclosure paths
+    FIELD_TREE_CACHE_SIZE = 1024
+
+    def __init__(self, blockchain, crypto_manager, ipfs_client, disclosure_store=None, course_catalog=None):
         self.blockchain = blockchain
         self.crypto_manager = crypto_manager
         self.ipfs_client = ipfs_client
         self.credentials_file = DATA_DIR / "credentials_registry.json"
+        # Interned course/backlog lists: identical lists across a cohort share one tuple in memory
+        # (the storage client's catalog when it has one, so a process keeps a single copy)
+        if course_catalog is None:
+            course_catalog = getattr(ipfs_client, "course_catalog", None)
+        if course_catalog is None:
+            course_catalog = CourseCatalog(self.credentials_file.parent / "course_catalog.json")
+        self.course_catalog = course_catalog
         self.credentials_registry = self.load_credentials_registry()
-        self.disclosure_registry = {}  # Initialize disclosure mapping for ELITE privacy proxy
+        # Expiring disclosure mapping for the ELITE privacy proxy (SQL-backed when a store is injected)
+        self.disclosure_registry = disclosure_store if disclosure_store is not None else DisclosureStore()
+        self.search_index = CredentialSearchIndex()
+        self.search_index.rebuild(self.credentials_registry)
+        # Per-student version chains: head = latest version, back links = lineage
+        self.version_index = CredentialVersionIndex()
+        self.version_index.rebuild(self.credentials_registry)
+        # Bloom filter + negative cache: bogus IDs on public verify paths are rejected without a lookup
+        self.existence_filter = CredentialExistenceFilter()
+        self.existence_filter.rebuild(self.credentials_registry)
+        # Published revocation bitstring (StatusList2021 style), kept in sync by _publish_registry
+        self.status_list = StatusList(crypto_manager, issuer_id=self._generate_issuer_id())
+        self.status_list.rebuild(self.credentials_registry)
+        # merkle_root -> MerkleTree for selective disclosure paths (leaves and root persist in the registry)
+        self._field_tree_cache = {}
+        # Single-writer lock: every registry mutation (and version reservation) happens under it
+        self._registry_lock = threading.RLock()
+        self._reserved_versions = {}
+        # credential_id -> signed CanonicalDocument handed from the sign stage to the store stage
+        self._signed_documents = {}
+        # Sweeper-verified document mirror: fast path for verify_credential (sweeper started by the app)
+        self.document_mirror = DocumentMirror(self)
 
     def _calculate_version_for_student(self, student_id):
         """Calculate version per student ID, not globally"""
-        existing_versions = []
-        for cred_id, registry_entry in self.credentials_registry.items():
-            if registry_entry.get("student_id") == student_id:
-                existing_versions.append(registry_entry.get("version", 1))
-
-        if not existing_versions:
-            return 1
-
-        return max(existing_versions) + 1
+        return self.version_index.latest_version(student_id) + 1
 
     def _get_latest_active_credential(self, student_id):
         """Get the latest ACTIVE credential for a student"""
-        active_credentials = []
-        for cred_id, registry_entry in self.credentials_registry.items():
-            if registry_entry.get("student_id") == student_id and registry_entry.get("status") == "active":
-                active_credentials.append(registry_entry)
-
-        if not active_credentials:
-            return None
-
-        latest = max(active_credentials, key=lambda x: x.get("version", 1))
-        return latest["credential_id"]
-
-    def _auto_revoke_previous_active(self, student_id, new_credential_id):
-        """Auto-revoke all ACTIVE credentials before issuing new one"""
-        superseded_count = 0
-        for cred_id, registry_entry in self.credentials_registry.items():
+        return self.version_index.latest_active(student_id)
+
+    def _auto_revoke_previous_active(self, student_id, new_credential_id, new_version=None):
+        """Auto-revoke all ACTIVE credentials before issuing new one (only older ones when new_version is given)"""
+        changes = {}
+        registry = self.credentials_registry
+        for cred_id in self.version_index.versions(student_id):
+            registry_entry = registry.get(cred_id, {})
             if (
-                registry_entry.get("student_id") == student_id
-                and registry_entry.get("status") == "active"
+                registry_entry.get("status") == "active"
                 and cred_id != new_credential_id
+                and (new_version is None or registry_entry.get("version", 1) < new_version)
             ):
-                registry_entry["status"] = "superseded"
-                registry_entry["superseded_by"] = new_credential_id
-                registry_entry["superseded_date"] = datetime.utcnow().isoformat()
-                superseded_count += 1
-
+                changes[cred_id] = dict(
+                    registry_entry,
+                    status="superseded",
+                    superseded_by=new_credential_id,
+                    superseded_date=datetime.utcnow().isoformat(),
+                )
                 logging.info(f"Auto-superseded credential {cred_id} (v{registry_entry.get('version')})")
 
-        return superseded_count
+        self._publish_registry(changes)
+        return len(changes)
+
+    # ==================== REGISTRY CONCURRENCY ====================
+    # Copy-on-write: the published registry dict and its entries are never mutated in place.
+    # Writers take _registry_lock, build replacement entries and swap in a new mapping; readers
+    # grab self.credentials_registry once and iterate it lock-free without ever seeing a torn state.
+
+    def _publish_registry(self, changes=None, removals=()):
+        """Swap in a new registry mapping with `changes` ({credential_id: entry}) applied"""
+        if not changes and not removals:
+            return
+        changes = {
+            credential_id: self.course_catalog.intern_entry(registry_entry)
+            for credential_id, registry_entry in (changes or {}).items()
+        }
+        with self._registry_lock:
+            previous = self.credentials_registry
+            registry = dict(previous)
+            registry.update(changes or {})
+            for credential_id in removals:
+                registry.pop(credential_id, None)
+            self.credentials_registry = registry
+            for credential_id, registry_entry in (changes or {}).items():
+                self.search_index.add(credential_id, registry_entry)
+                self.version_index.add(credential_id, registry_entry)
+                old_entry = previous.get(credential_id) or {}
+                old_index = old_entry.get("status_list_index")
+                if old_index is not None and old_index != registry_entry.get("status_list_index"):
+                    self.status_list.release(old_index, credential_id)  # e.g. an import with overwrite
+                self.status_list.apply_entry(registry_entry, credential_id)
+                if credential_id not in previous:
+                    self.existence_filter.add(credential_id)
+                if old_entry.get("ipfs_cid") != registry_entry.get("ipfs_cid") or old_entry.get(
+                    "credential_hash"
+                ) != registry_entry.get("credential_hash"):
+                    self.document_mirror.mark_dirty(credential_id)
+            if self.existence_filter.saturated:
+                self.existence_filter.rebuild(registry)
+            for credential_id in removals:
+                self.search_index.remove(credential_id)
+                self.version_index.remove(credential_id)
+                old_index = (previous.get(credential_id) or {}).get("status_list_index")
+                if old_index is not None:
+                    self.status_list.release(old_index, credential_id)
+
+    def _update_registry_entry(self, credential_id, **fields):
+        """Replace one entry with an updated copy; returns the new entry (None if it no longer exists)"""
+        with self._registry_lock:
+            registry_entry = self.credentials_registry.get(credential_id)
+            if registry_entry is None:
+                return None
+            updated_entry = dict(registry_entry, **fields)
+            self._publish_registry({credential_id: updated_entry})
+            return updated_entry
 
     def _generate_credential_hash(self, credential_data):
         """Generate SHA-256 hash of credential (for integrity)"""
-        canonical_json = json.dumps(credential_data, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(canonical_json.encode()).hexdigest()
+        return CanonicalDocument.wrap(credential_data).sha256_hex
 
     def _generate_issuer_id(self):
         """Generate DID-style issuer identifier"""
@@ -112,89 +193,435 @@ class CredentialManager:
                 fields[k] = v
         return fields
 
+    def _field_merkle_fingerprint(self, registry_entry, credential_hash=None):
+        """
+        Identifies the inputs of a credential's field tree. Subject fields are covered by the
+        credential hash and registry metadata is fixed at issuance, except for status.
+        """
+        return f"{credential_hash or registry_entry.get('credential_hash')}|{registry_entry.get('status')}"
+
+    def _get_field_merkle_tree(self, registry_entry, all_fields, field_salts):
+        """Return (merkle_tree, field_tree), building and persisting the tree on first use for older entries"""
+        fingerprint = self._field_merkle_fingerprint(registry_entry)
+        merkle_tree = registry_entry.get("merkle_tree")
+
+        if (
+            not merkle_tree
+            or merkle_tree.get("fingerprint") != fingerprint
+            or set(merkle_tree.get("leaves", {})) != set(all_fields)
+        ):
+            merkle_tree = self.crypto_manager.build_field_merkle_tree(all_fields, field_salts)
+            merkle_tree["fingerprint"] = fingerprint
+            self._update_registry_entry(registry_entry["credential_id"], merkle_tree=merkle_tree)
+            self.save_credentials_registry()
+
+        merkle_root = merkle_tree["root"]
+        field_tree = self._field_tree_cache.get(merkle_root)
+        if field_tree is None:
+            field_tree = self.crypto_manager.create_merkle_tree(list(merkle_tree["leaves"].values()))
+            if len(self._field_tree_cache) >= self.FIELD_TREE_CACHE_SIZE:
+                self._field_tree_cache.pop(next(iter(self._field_tree_cache)))
+            self._field_tree_cache[merkle_root] = field_tree
+
+        return merkle_tree, field_tree
+
     def issue_credential(self, transcript_data, replaces=None):
         """Issue a new verifiable credential with COMPLETE metadata"""
+        issuance = None
         try:
-            student_id = transcript_data["student_id"]
-            version = self._calculate_version_for_student(student_id)
-            credential_id = str(uuid.uuid4())
-            previous_credential_id = self._get_latest_active_credential(student_id)
-            issued_at = datetime.utcnow().isoformat() + "Z"
-
-            credential = {
-                "@context": ["https://www.w3.org/2018/credentials/v1", "https://example.org/academic/v1"],
-                "id": f"urn:uuid:{credential_id}",
-                "type": ["VerifiableCredential", "AcademicTranscript"],
-                "version": version,
-                "replaces": previous_credential_id,
-                "issuer": {
-                    "id": self._generate_issuer_id(),
-                    "name": "G. Pulla Reddy Engineering College",
-                    "department": "Computer Science Engineering",
-                },
-                "issuanceDate": issued_at,
-                "credentialSubject": {
-                    "id": self._generate_holder_id(student_id),
-                    "name": transcript_data["student_name"],
-                    "studentId": transcript_data["student_id"],
-                    "degree": transcript_data["degree"],
-                    "department": transcript_data.get("department"),
-                    "studentStatus": transcript_data.get("student_status"),
-                    "college": transcript_data.get("college"),
-                    "university": transcript_data["university"],
-                    "cgpa": transcript_data.get("cgpa"),
-                    "gpa": transcript_data.get("gpa"),
-                    "graduationYear": transcript_data.get("graduation_year"),
-                    "batch": transcript_data.get("batch"),
-                    "conduct": transcript_data.get("conduct"),
-                    "backlogCount": transcript_data.get("backlog_count"),
-                    "courses": transcript_data.get("courses", []),
-                    "backlogs": transcript_data.get("backlogs", []),
-                    "issueDate": transcript_data["issue_date"],
-                    "semester": transcript_data.get("semester"),
-                    "year": transcript_data.get("year"),
-                    "section": transcript_data.get("section"),
-                },
+            issuance = self.prepare_issuance(transcript_data)
+            for stage in (self.sign_issuance, self.store_issuance, self.anchor_issuance):
+                stage_result = stage(issuance)
+                if not stage_result["success"]:
+                    self.release_issuance(issuance)
+                    return stage_result
+            return self.index_issuance(issuance)
+
+        except Exception as e:
+            logging.error(f" Error issuing credential: {str(e)}")
+            if issuance:
+                self.release_issuance(issuance)
+            return {"success": False, "error": str(e)}
+
+    MAX_BATCH_ISSUANCES = 5000
+
+    def issue_credentials_batch(self, transcripts):
+        """
+        Issue many credentials with a single signing operation (see sign_issuances) and a single block
+        (see anchor_issuances). Storing and indexing still run per credential; the registry is written
+        once at the end. Returns per-item results in input order.
+        """
+        transcripts = list(transcripts or [])
+        if not transcripts:
+            return {"success": False, "error": "No transcripts provided"}
+        if len(transcripts) > self.MAX_BATCH_ISSUANCES:
+            return {"success": False, "error": f"Too many transcripts (max {self.MAX_BATCH_ISSUANCES})"}
+
+        results = [None] * len(transcripts)
+        prepared = []  # (position, issuance)
+        seen_students = set()
+        try:
+            for position, transcript_data in enumerate(transcripts):
+                student_id = transcript_data.get("student_id")
+                if student_id in seen_students:
+                    # Versioning reads the registry, so one batch issues at most one credential per student
+                    results[position] = {"success": False, "error": f"Duplicate student in batch: {student_id}"}
+                    continue
+                seen_students.add(student_id)
+                try:
+                    prepared.append((position, self.prepare_issuance(transcript_data)))
+                except Exception as e:
+                    results[position] = {"success": False, "error": str(e)}
+
+            if prepared:
+                sign_result = self.sign_issuances([issuance for _, issuance in prepared])
+                if not sign_result["success"]:
+                    for position, issuance in prepared:
+                        self.release_issuance(issuance)
+                        results[position] = sign_result
+                    prepared = []
+
+            stored = []
+            for position, issuance in prepared:
+                try:
+                    stage_result = self.store_issuance(issuance)
+                except Exception as e:
+                    stage_result = {"success": False, "error": str(e)}
+                if stage_result["success"]:
+                    stored.append((position, issuance))
+                else:
+                    self.release_issuance(issuance)
+                    results[position] = stage_result
+            prepared = stored
+
+            if prepared:
+                try:
+                    anchor_result = self.anchor_issuances([issuance for _, issuance in prepared])
+                except Exception as e:
+                    anchor_result = {"success": False, "error": str(e)}
+                if not anchor_result["success"]:
+                    for position, issuance in prepared:
+                        self.release_issuance(issuance)
+                        results[position] = anchor_result
+                    prepared = []
+
+            for position, issuance in prepared:
+                try:
+                    results[position] = self.index_issuance(issuance, persist=False)
+                except Exception as e:
+                    self.release_issuance(issuance)
+                    results[position] = {"success": False, "error": str(e)}
+            if prepared:
+                self.save_credentials_registry()
+
+        except Exception as e:
+            logging.error(f" Error batch issuing credentials: {str(e)}")
+            for _, issuance in prepared:
+                self.release_issuance(issuance)
+            return {"success": False, "error": str(e)}
+
+        issued = sum(1 for result in results if result["success"])
+        logging.info(f"Batch issued {issued}/{len(results)} credential(s) with one signature and one block")
+        if not issued:
+            return {
+                "success": False,
+                "error": "None of the credentials could be issued",
+                "issued": 0,
+                "failed": len(results),
+                "results": results,
             }
+        return {
+            "success": True,
+            "issued": issued,
+            "failed": len(results) - issued,
+            "results": results,
+        }
 
-            credential_hash = self._generate_credential_hash(credential)
-            signature = self.crypto_manager.sign_data(credential)
-            if not signature:
-                return {"success": False, "error": "Failed to create digital signature"}
+    # ==================== ISSUANCE STAGES ====================
+    # issue_credential runs these back to back; core.issuance_pipeline runs them as separate
+    # queued stages. The issuance dict only holds JSON-serializable state so a job can resume
+    # from its last completed stage after a crash.
+
+    def _reserve_version(self, student_id):
+        """Hand out the next version for a student, accounting for issuances still in flight"""
+        with self._registry_lock:
+            version = max(
+                self._calculate_version_for_student(student_id), self._reserved_versions.get(student_id, 0) + 1
+            )
+            self._reserved_versions[student_id] = version
+            return version
+
+    def reserve_issuance(self, issuance):
+        """
+        Re-reserve the version and status index of an issuance resumed after a restart. Neither
+        reservation is persisted, so without this a new issuance could be handed the same ones.
+        """
+        with self._registry_lock:
+            student_id = issuance["student_id"]
+            self._reserved_versions[student_id] = max(self._reserved_versions.get(student_id, 0), issuance["version"])
+        self.status_list.reserve(issuance["status_list_index"], issuance["credential_id"])
+
+    def release_issuance(self, issuance):
+        """Give back a reserved version when an issuance fails before reaching the registry"""
+        with self._registry_lock:
+            if self._reserved_versions.get(issuance.get("student_id")) == issuance.get("version"):
+                self._reserved_versions[issuance["student_id"]] = issuance["version"] - 1
+        self._signed_documents.pop(issuance.get("credential_id"), None)
+
+    def prepare_issuance(self, transcript_data):
+        """Validate stage: reserve id/version and build the unsigned credential document"""
+        student_id = transcript_data["student_id"]
+        credential_id = str(uuid.uuid4())
+        version = self._reserve_version(student_id)
+        previous_credential_id = self._get_latest_active_credential(student_id)
+        issued_at = datetime.utcnow().isoformat() + "Z"
+        status_list_index = self.status_list.allocate()
+
+        credential = {
+            "@context": ["https://www.w3.org/2018/credentials/v1", "https://example.org/academic/v1"],
+            "id": f"urn:uuid:{credential_id}",
+            "type": ["VerifiableCredential", "AcademicTranscript"],
+            "version": version,
+            "replaces": previous_credential_id,
+            "issuer": {
+                "id": self._generate_issuer_id(),
+                "name": "G. Pulla Reddy Engineering College",
+                "department": "Computer Science Engineering",
+            },
+            "issuanceDate": issued_at,
+            "credentialSubject": {
+                "id": self._generate_holder_id(student_id),
+                "name": transcript_data["student_name"],
+                "studentId": transcript_data["student_id"],
+                "degree": transcript_data["degree"],
+                "department": transcript_data.get("department"),
+                "studentStatus": transcript_data.get("student_status"),
+                "college": transcript_data.get("college"),
+                "university": transcript_data["university"],
+                "cgpa": transcript_data.get("cgpa"),
+                "gpa": transcript_data.get("gpa"),
+                "graduationYear": transcript_data.get("graduation_year"),
+                "batch": transcript_data.get("batch"),
+                "conduct": transcript_data.get("conduct"),
+                "backlogCount": transcript_data.get("backlog_count"),
+                "courses": transcript_data.get("courses", []),
+                "backlogs": transcript_data.get("backlogs", []),
+                "issueDate": transcript_data["issue_date"],
+                "semester": transcript_data.get("semester"),
+                "year": transcript_data.get("year"),
+                "section": transcript_data.get("section"),
+            },
+            "credentialStatus": self.status_list.entry_for(status_list_index),
+        }
 
-            credential["proof"] = {
-                "type": "RsaSignature2018",
-                "created": issued_at,
-                "verificationMethod": f"{self._generate_issuer_id()}#keys-1",
+        return {
+            "transcript_data": transcript_data,
+            "student_id": student_id,
+            "credential_id": credential_id,
+            "version": version,
+            "previous_credential_id": previous_credential_id,
+            "issued_at": issued_at,
+            "status_list_index": status_list_index,
+            "credential": credential,
+        }
+
+    def sign_issuance(self, issuance):
+        """Sign stage: hash + sign the document and attach the proof"""
+        credential = issuance["credential"]
+        credential.pop("proof", None)  # Resumed job: re-sign the bare document
+
+        # Serialize once: the hash and the signature read cached bytes of the same document.
+        # The hash is computed while the signature is in flight on the signing pool.
+        document = CanonicalDocument(credential)
+        pending_signature = self.crypto_manager.sign_data_async(document)
+        credential_hash = self._generate_credential_hash(document)
+        signature = pending_signature.result(timeout=30)
+        if not signature:
+            return {"success": False, "error": "Failed to create digital signature"}
+
+        kid = self.crypto_manager.signature_key_id(signature)
+        self._attach_proof(
+            issuance, document, credential_hash, signature, proof_type=self.crypto_manager.proof_type_for(kid), kid=kid
+        )
+        return {"success": True}
+
+    def sign_issuances(self, issuances):
+        """
+        Batch sign stage: one signature over the Merkle root of every document hash in the batch.
+        Each credential gets a MerkleProof2019 proof (its inclusion path + the shared root signature).
+        """
+        for issuance in issuances:
+            issuance["credential"].pop("proof", None)
+        documents = [CanonicalDocument(issuance["credential"]) for issuance in issuances]
+        batch_proofs = self.crypto_manager.sign_batch(documents)
+        if batch_proofs is None:
+            return {"success": False, "error": "Failed to create batch signature"}
+
+        for issuance, document, batch_proof in zip(issuances, documents, batch_proofs):
+            signature = batch_proof["signatureValue"]
+            self._attach_proof(
+                issuance,
+                document,
+                self._generate_credential_hash(document),
+                signature,
+                proof_type=self.crypto_manager.BATCH_PROOF_TYPE,
+                kid=self.crypto_manager.signature_key_id(signature),
+                merkleRoot=batch_proof["merkleRoot"],
+                merklePath=batch_proof["merklePath"],
+            )
+        return {"success": True}
+
+    def _attach_proof(self, issuance, document, credential_hash, signature, proof_type, kid, **extra):
+        signed_document = document.with_fields(
+            proof={
+                "type": proof_type,
+                "created": issuance["issued_at"],
+                "verificationMethod": f"{self._generate_issuer_id()}#{kid}",
+                **extra,
                 "signatureValue": signature,
             }
+        )
+        self._signed_documents[issuance["credential_id"]] = signed_document
+        issuance["credential"] = signed_document.data
+        issuance["credential_hash"] = credential_hash
+        issuance["signature"] = signature
+
+    def store_issuance(self, issuance):
+        """Store stage: pin the signed document (content-addressed, so safe to repeat)"""
+        # Reuse the signed document's serialized fragments when the sign stage ran in this process
+        document = self._signed_documents.pop(issuance["credential_id"], None)
+        if document is None or document.data.get("proof", {}).get("signatureValue") != issuance["signature"]:
+            document = CanonicalDocument(issuance["credential"])
+        ipfs_cid = self.ipfs_client.add_json(document)
+        if not ipfs_cid:
+            return {"success": False, "error": "Failed to store credential on IPFS"}
+
+        issuance["ipfs_cid"] = ipfs_cid
+        return {"success": True}
+
+    # Fields every credential of a credential_issuance_batch block shares (stored once on the block)
+    BATCH_BLOCK_SHARED_FIELDS = ("signature", "issuer", "issuer_id", "schema_type", "schema_version")
+
+    @classmethod
+    def _issuance_records(cls, block):
+        """Per-credential issuance data of a credential_issuance or credential_issuance_batch block"""
+        data = block.data if isinstance(block.data, dict) else {}
+        if data.get("type") == "credential_issuance":
+            yield data
+        elif data.get("type") == "credential_issuance_batch":
+            shared = {field: data.get(field) for field in cls.BATCH_BLOCK_SHARED_FIELDS}
+            for record in data.get("credentials", []):
+                yield dict(shared, type="credential_issuance", **record)
+
+    def _find_issuance_block(self, credential_id):
+        for block in reversed(self.blockchain.chain):
+            data = block.data if isinstance(block.data, dict) else {}
+            if data.get("type") == "credential_issuance" and data.get("credential_id") == credential_id:
+                return block
+        return None
 
-            ipfs_cid = self.ipfs_client.add_json(credential)
-            if not ipfs_cid:
-                return {"success": False, "error": "Failed to store credential on IPFS"}
+    def _issuance_block_data(self, issuance):
+        transcript_data = issuance["transcript_data"]
+        student_id = issuance["student_id"]
+        return {
+            "credential_id": issuance["credential_id"],
+            "ipfs_cid": issuance["ipfs_cid"],
+            "credential_hash": issuance["credential_hash"],
+            "signature": issuance["signature"],
+            "issuer": issuance["credential"]["issuer"]["name"],
+            "issuer_id": self._generate_issuer_id(),
+            "holder_id": self._generate_holder_id(student_id),
+            "subject_id": student_id,
+            "subject_name": transcript_data["student_name"],
+            "issue_date": issuance["issued_at"],
+            "version": issuance["version"],
+            "previous_credential_id": issuance["previous_credential_id"],
+            "type": "credential_issuance",
+            "schema_type": "AcademicTranscriptCredential",
+            "schema_version": "1.0",
+        }
 
-            blockchain_data = {
-                "credential_id": credential_id,
-                "ipfs_cid": ipfs_cid,
-                "credential_hash": credential_hash,
-                "signature": signature,
-                "issuer": credential["issuer"]["name"],
-                "issuer_id": self._generate_issuer_id(),
-                "holder_id": self._generate_holder_id(student_id),
-                "subject_id": student_id,
-                "subject_name": transcript_data["student_name"],
-                "issue_date": issued_at,
-                "version": version,
-                "previous_credential_id": previous_credential_id,
-                "type": "credential_issuance",
-                "schema_type": "AcademicTranscriptCredential",
-                "schema_version": "1.0",
+    def anchor_issuance(self, issuance, resume=False):
+        """Anchor stage: write the issuance block (a resumed job reuses a block it already wrote)"""
+        block = self._find_issuance_block(issuance["credential_id"]) if resume else None
+
+        if block is None:
+            block = self.blockchain.add_block(self._issuance_block_data(issuance))
+
+        issuance["block_number"] = block.index
+        issuance["block_hash"] = block.hash
+        return {"success": True}
+
+    def anchor_issuances(self, issuances):
+        """
+        Batch anchor stage: ONE credential_issuance_batch block (one proof-of-work round, one block
+        signature) for credentials signed together by sign_issuances. The shared root signature and
+        issuer fields are stored once; each credential keeps its own record under "credentials".
+        """
+        records = []
+        for issuance in issuances:
+            record = self._issuance_block_data(issuance)
+            for field in ("type", *self.BATCH_BLOCK_SHARED_FIELDS):
+                record.pop(field)
+            records.append(record)
+
+        first = self._issuance_block_data(issuances[0])
+        blockchain_data = {field: first[field] for field in self.BATCH_BLOCK_SHARED_FIELDS}
+        blockchain_data.update(
+            {
+                "type": "credential_issuance_batch",
+                "batch_merkle_root": issuances[0]["credential"]["proof"]["merkleRoot"],
+                "credential_ids": [record["credential_id"] for record in records],
+                "credentials": records,
             }
+        )
+        block = self.blockchain.add_block(blockchain_data)
+
+        for issuance in issuances:
+            issuance["block_number"] = block.index
+            issuance["block_hash"] = block.hash
+        return {"success": True}
+
+    def _issuance_result(self, issuance, superseded_count):
+        version = issuance["version"]
+        return {
+            "success": True,
+            "credential_id": issuance["credential_id"],
+            "version": version,
+            "ipfs_cid": issuance["ipfs_cid"],
+            "block_hash": issuance["block_hash"],
+            "block_number": issuance["block_number"],
+            "transaction_id": issuance["block_hash"],
+            "tx_hash": issuance["block_hash"],
+            "credential_hash": issuance["credential_hash"],
+            "superseded_count": superseded_count,
+            "student_id": issuance["student_id"],
+            "message": f"Credential v{version} issued successfully (superseded {superseded_count} old version(s))",
+        }
 
-            block = self.blockchain.add_block(blockchain_data)
-            block_number = block.index
-            transaction_hash = block.hash
-            superseded_count = self._auto_revoke_previous_active(student_id, credential_id)
+    def index_issuance(self, issuance, persist=True):
+        """Index stage: supersede older versions, write the registry entry and persist (batches persist once)"""
+        credential_id = issuance["credential_id"]
+        existing_entry = self.credentials_registry.get(credential_id)
+        if existing_entry is not None:
+            return self._issuance_result(issuance, existing_entry.get("superseded_count", 0))
+
+        transcript_data = issuance["transcript_data"]
+        student_id = issuance["student_id"]
+        version = issuance["version"]
+        credential = issuance["credential"]
+        credential_hash = issuance["credential_hash"]
+        signature = issuance["signature"]
+        ipfs_cid = issuance["ipfs_cid"]
+        block_number = issuance["block_number"]
+        transaction_hash = issuance["block_hash"]
+        previous_credential_id = issuance["previous_credential_id"]
+        issued_at = issuance["issued_at"]
+
+        with self._registry_lock:
+            superseded_count = self._auto_revoke_previous_active(student_id, credential_id, new_version=version)
+            # Pipelined issuances can reach this stage out of order: a newer version already indexed wins
+            newer_active_id = self._get_latest_active_credential(student_id)
 
             #  SECURITY: Generate immutable salts for ALL possible fields at issuance
             # Temporary entry to gather fields
@@ -210,18 +637,20 @@ class CredentialManager:
             }
             all_fields = self._gather_all_fields(temp_entry, credential["credentialSubject"])
             field_salts = {field: secrets.token_hex(16) for field in all_fields}
+            merkle_tree = self.crypto_manager.build_field_merkle_tree(all_fields, field_salts)
+            merkle_tree["fingerprint"] = self._field_merkle_fingerprint(temp_entry, credential_hash)
 
-            self.credentials_registry[credential_id] = {
+            new_entry = {
                 "credential_id": credential_id,
                 "issuer_id": self._generate_issuer_id(),
                 "holder_id": self._generate_holder_id(student_id),
                 "credential_hash": credential_hash,
                 "signature": signature,
                 "issuer_signature": signature,
-                "issuer_public_key_id": "rsa-key-2048",
+                "issuer_public_key_id": self.crypto_manager.signature_key_id(signature),
                 "ipfs_cid": ipfs_cid,
                 "tx_hash": transaction_hash,
-                "block_hash": block.hash,
+                "block_hash": transaction_hash,
                 "block_number": block_number,
                 "network_id": "local-dev-chain",
                 "version": version,
@@ -259,42 +688,36 @@ class CredentialManager:
                 "revocation_category": None,
                 "superseded_count": superseded_count,
                 "field_salts": field_salts,  #  Persist salts for Merkle tree proofs
+                "merkle_tree": merkle_tree,  #  Precomputed salted leaves + root for selective disclosure
+                "status_list_index": issuance.get("status_list_index"),
             }
+            if newer_active_id and self.credentials_registry[newer_active_id].get("version", 1) > version:
+                new_entry.update(
+                    {
+                        "status": "superseded",
+                        "superseded_by": newer_active_id,
+                        "superseded_date": datetime.utcnow().isoformat(),
+                    }
+                )
+            self._publish_registry({credential_id: new_entry})
+
+            if persist:
+                self.save_credentials_registry()
 
-            self.save_credentials_registry()
-
-            logging.info(f"Credential v{version} issued for student {student_id}")
-            logging.info(f"   Superseded {superseded_count} previous credential(s)")
-
-            return {
-                "success": True,
-                "credential_id": credential_id,
-                "version": version,
-                "ipfs_cid": ipfs_cid,
-                "block_hash": block.hash,
-                "block_number": block_number,
-                "transaction_id": transaction_hash,
-                "tx_hash": transaction_hash,
-                "credential_hash": credential_hash,
-                "superseded_count": superseded_count,
-                "student_id": student_id,
-                "message": f"Credential v{version} issued successfully (superseded {superseded_count} old version(s))",
-            }
+        logging.info(f"Credential v{version} issued for student {student_id}")
+        logging.info(f"   Superseded {superseded_count} previous credential(s)")
 
-        except Exception as e:
-            logging.error(f" Error issuing credential: {str(e)}")
-            return {"success": False, "error": str(e)}
+        return self._issuance_result(issuance, superseded_count)
 
     def create_new_version(self, old_credential_id, updated_data, reason):
         """Create a new version of a credential (for corrections/updates)"""
         try:
             old_cred_id = self._normalize_credential_id(old_credential_id)
 
-            if old_cred_id not in self.credentials_registry:
+            old_credential = self.credentials_registry.get(old_cred_id)
+            if old_credential is None:
                 return {"success": False, "error": "Original credential not found"}
 
-            old_credential = self.credentials_registry[old_cred_id]
-
             if old_credential["status"] == "superseded":
                 return {"success": False, "error": "Cannot create new version of superseded credential"}
 
@@ -323,43 +746,99 @@ class CredentialManager:
             logging.error(f" Error creating new version: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    def _check_registry_status(self, credential_id):
+        """Resolve a registry entry and reject missing/revoked/superseded credentials early"""
+        registry_entry = None
+        if self.existence_filter.might_exist(credential_id):
+            registry_entry = self.credentials_registry.get(credential_id)
+            if registry_entry is None:
+                self.existence_filter.remember_missing(credential_id)
+        if registry_entry is None:
+            return None, {
+                "valid": False,
+                "status": "not_found",
+                "error": "Credential not found in registry",
+                "details": "This credential ID does not exist in our system",
+            }
+
+        credential_status = registry_entry.get("status", "active")
+
+        if credential_status == "revoked":
+            return registry_entry, {
+                "valid": False,
+                "status": "revoked",
+                "error": "Credential has been revoked",
+                "details": f"Revoked on: {registry_entry.get('revoked_at', 'Unknown')}",
+                "revocation_reason": registry_entry.get("revocation_reason", "No reason provided"),
+                "credential": registry_entry,
+            }
+
+        if credential_status == "superseded":
+            return registry_entry, {
+                "valid": False,
+                "status": "superseded",
+                "error": "Credential has been superseded by a newer version",
+                "details": "This is an old version. A newer credential exists for this student.",
+                "credential": registry_entry,
+            }
+
+        return registry_entry, None
+
     def verify_credential(self, credential_id):
         """Verify the authenticity of a credential"""
         try:
             credential_id = self._normalize_credential_id(credential_id)
 
-            if credential_id not in self.credentials_registry:
-                return {
-                    "valid": False,
-                    "status": "not_found",
-                    "error": "Credential not found in registry",
-                    "details": "This credential ID does not exist in our system",
-                }
-
-            registry_entry = self.credentials_registry[credential_id]
-            credential_status = registry_entry.get("status", "active")
+            registry_entry, early_result = self._check_registry_status(credential_id)
+            if early_result:
+                return early_result
+
+            # Fast path: document passed a full check recently (sweeper or an earlier request)
+            mirrored = self.document_mirror.lookup(credential_id, registry_entry)
+            if mirrored:
+                document, record = mirrored
+                return self._verified_result(
+                    credential_id,
+                    registry_entry,
+                    document.data,
+                    record.get("block_ok", True),
+                    last_verified_at=datetime.utcfromtimestamp(record["verified_at"]).isoformat() + "Z",
+                    verified_via="mirror",
+                )
+
+            credential = self.ipfs_client.get_canonical(registry_entry["ipfs_cid"])
+            block = self.blockchain.find_credential_block(credential_id) if credential else None
+
+            result = self._verify_credential_document(
+                credential_id,
+                registry_entry,
+                credential,
+                chain_valid=self.blockchain.is_chain_valid,
+                blockchain_lookup_ok=bool(block),
+            )
+            if result.get("valid"):
+                self.document_mirror.record(credential_id, registry_entry, credential, block_ok=bool(block))
+            return result
 
-            if credential_status == "revoked":
-                return {
-                    "valid": False,
-                    "status": "revoked",
-                    "error": "Credential has been revoked",
-                    "details": f"Revoked on: {registry_entry.get('revoked_at', 'Unknown')}",
-                    "revocation_reason": registry_entry.get("revocation_reason", "No reason provided"),
-                    "credential": registry_entry,
-                }
+        except Exception as e:
+            logging.error(f" Error verifying credential: {str(e)}")
+            import traceback
 
-            if credential_status == "superseded":
-                return {
-                    "valid": False,
-                    "status": "superseded",
-                    "error": "Credential has been superseded by a newer version",
-                    "details": "This is an old version. A newer credential exists for this student.",
-                    "credential": registry_entry,
-                }
+            traceback.print_exc()
+            return {
+                "valid": False,
+                "status": "error",
+                "error": f"Verification error: {str(e)}",
+                "details": "An unexpected error occurred during verification",
+            }
 
-            credential = self.ipfs_client.get_json(registry_entry["ipfs_cid"])
-            if not credential:
+    def _verify_credential_document(self, credential_id, registry_entry, credential, chain_valid, blockchain_lookup_ok):
+        """
+        Integrity checks for an already-fetched credential document (dict or CanonicalDocument).
+        chain_valid may be a bool (shared batch result) or a callable evaluated lazily.
+        """
+        try:
+            if credential is None or (isinstance(credential, dict) and not credential):
                 return {
                     "valid": False,
                     "status": "ipfs_error",
@@ -367,10 +846,10 @@ class CredentialManager:
                     "details": "Storage system error",
                 }
 
-            block = self.blockchain.find_credential_block(credential_id)
-            blockchain_lookup_ok = bool(block)
+            if callable(chain_valid):
+                chain_valid = chain_valid()
 
-            if not self.blockchain.is_chain_valid():
+            if not chain_valid:
                 return {
                     "valid": False,
                     "status": "blockchain_compromised",
@@ -378,9 +857,10 @@ class CredentialManager:
                     "details": "The blockchain has been tampered with",
                 }
 
-            credential_without_proof = credential.copy()
-            if "proof" in credential_without_proof:
-                del credential_without_proof["proof"]
+            # Hash and signature both read the cached serialization of the unsigned document
+            document = CanonicalDocument.wrap(credential)
+            credential = document.data
+            credential_without_proof = document.without("proof")
 
             current_hash = self._generate_credential_hash(credential_without_proof)
             stored_hash = registry_entry.get("credential_hash")
@@ -402,7 +882,8 @@ class CredentialManager:
                     "details": "This credential is missing a digital signature",
                 }
 
-            if not self.crypto_manager.verify_signature(credential_without_proof, signature):
+            # Direct signature or a batch Merkle proof (inclusion path + one signature over the batch root)
+            if not self.crypto_manager.verify_proof(credential_without_proof, credential["proof"]):
                 return {
                     "valid": False,
                     "status": "invalid_signature",
@@ -412,22 +893,7 @@ class CredentialManager:
 
             logging.info(f"Credential verified successfully: {credential_id}")
 
-            return {
-                "valid": True,
-                "status": "active",
-                "credential": credential,
-                "registry_entry": registry_entry,
-                "verification_details": {
-                    "blockchain_verified": blockchain_lookup_ok,
-                    "signature_verified": True,
-                    "hash_verified": True,
-                    "status_verified": True,
-                    "block_lookup_warning": None
-                    if blockchain_lookup_ok
-                    else "Blockchain block lookup unavailable; verified via registry hash and signature.",
-                    "verification_date": datetime.utcnow().isoformat() + "Z",
-                },
-            }
+            return self._verified_result(credential_id, registry_entry, credential, blockchain_lookup_ok)
 
         except Exception as e:
             logging.error(f" Error verifying credential: {str(e)}")
@@ -441,6 +907,84 @@ class CredentialManager:
                 "details": "An unexpected error occurred during verification",
             }
 
+    def _verified_result(self, credential_id, registry_entry, credential, blockchain_lookup_ok, **details):
+        """Successful verification response (extra details, e.g. mirror provenance, go in verification_details)"""
+        return {
+            "valid": True,
+            "status": "active",
+            "credential": credential,
+            "registry_entry": registry_entry,
+            "verification_details": {
+                "blockchain_verified": blockchain_lookup_ok,
+                "signature_verified": True,
+                "hash_verified": True,
+                "status_verified": True,
+                "block_lookup_warning": None
+                if blockchain_lookup_ok
+                else "Blockchain block lookup unavailable; verified via registry hash and signature.",
+                "verification_date": datetime.utcnow().isoformat() + "Z",
+                **details,
+            },
+        }
+
+    def verify_credentials_batch(self, credential_ids, max_workers=8):
+        """
+        Verify many credentials at once (employer / HR bulk checks).
+        Shares work across the batch: one chain-validity check, one chain scan for block lookups,
+        one IPFS fetch per distinct CID, and hash/signature checks fanned out over a thread pool.
+        Yields (credential_id, result) tuples in completion order.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        unique_ids = []
+        seen = set()
+        for raw_id in credential_ids or []:
+            cred_id = self._normalize_credential_id(str(raw_id).strip())
+            if cred_id and cred_id not in seen:
+                seen.add(cred_id)
+                unique_ids.append(cred_id)
+
+        pending = []
+        for cred_id in unique_ids:
+            registry_entry, early_result = self._check_registry_status(cred_id)
+            if early_result:
+                yield cred_id, early_result
+            else:
+                pending.append((cred_id, registry_entry))
+
+        if not pending:
+            return
+
+        chain_valid = self.blockchain.is_chain_valid()
+        anchored_ids = set()
+        for block in self.blockchain.chain:
+            if isinstance(block.data, dict):
+                anchored_ids.add(block.data.get("credential_id"))
+                anchored_ids.update(block.data.get("credential_ids", ()))
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+            # Deduplicate storage round trips: one fetch per distinct CID, shared by every credential using it
+            fetches = {}
+            for _, registry_entry in pending:
+                cid = registry_entry.get("ipfs_cid")
+                if cid and cid not in fetches:
+                    fetches[cid] = executor.submit(self.ipfs_client.get_canonical, cid)
+
+            def verify_one(cred_id, registry_entry):
+                fetch = fetches.get(registry_entry.get("ipfs_cid"))
+                credential = fetch.result() if fetch else None
+                return self._verify_credential_document(
+                    cred_id,
+                    registry_entry,
+                    credential,
+                    chain_valid=chain_valid,
+                    blockchain_lookup_ok=cred_id in anchored_ids,
+                )
+
+            futures = {executor.submit(verify_one, cred_id, entry): cred_id for cred_id, entry in pending}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
     def normalize_domain(self, domain_input):
         """
         [Security Fix #2] Normalize verifier domains.
@@ -501,11 +1045,14 @@ class CredentialManager:
             if not field_salts:
                 # Emergency fallback if salts were not generated at issuance (migration path)
                 field_salts = {field: secrets.token_hex(16) for field in all_fields}
-                registry_entry["field_salts"] = field_salts
+                registry_entry = self._update_registry_entry(credential_id, field_salts=field_salts, merkle_tree=None)
                 self.save_credentials_registry()
 
-            # Create cryptographic proof
-            proof = self.crypto_manager.create_proof_for_fields(all_fields, disclosed_data, field_salts)
+            # Create cryptographic proof from the cached tree (only paths + signature are per-disclosure)
+            merkle_tree, field_tree = self._get_field_merkle_tree(registry_entry, all_fields, field_salts)
+            proof = self.crypto_manager.create_proof_for_fields(
+                all_fields, disclosed_data, field_salts, merkle_tree=merkle_tree, field_tree=field_tree
+            )
 
             # Create disclosure document
             disclosure_doc = {
@@ -525,15 +1072,15 @@ class CredentialManager:
             }
 
             #  REGISTER DISCLOSURE (Hidden Registry for verification proxy)
-            if not hasattr(self, "disclosure_registry"):
-                self.disclosure_registry = {}
-
-            self.disclosure_registry[disclosure_id] = {
-                "original_id": credential_id,
-                "verifier": domain_ctx,
-                "expires_at": expires_at,
-                "created_at": datetime.utcnow().isoformat(),
-            }
+            self.disclosure_registry.put(
+                disclosure_id,
+                {
+                    "original_id": credential_id,
+                    "verifier": domain_ctx,
+                    "expires_at": expires_at,
+                    "created_at": datetime.utcnow().isoformat(),
+                },
+            )
 
             return {
                 "success": True,
@@ -577,21 +1124,93 @@ class CredentialManager:
             logging.error(f"Error verifying blind disclosure: {str(e)}")
             return {"valid": False, "error": str(e)}
 
-    def get_all_credentials(self):
-        """Get all credentials in the registry"""
-        credentials = []
-        for cred_id, registry_entry in self.credentials_registry.items():
-            full_credential = self.ipfs_client.get_json(registry_entry["ipfs_cid"])
-            if full_credential:
-                registry_entry["full_credential"] = full_credential["credentialSubject"]
-            credentials.append(registry_entry)
-        return credentials
+    def get_all_credentials(self, include_documents=True):
+        """Get all credentials in the registry (copies; the shared registry entries are never mutated)"""
+        return self.list_credentials(page=None, include_documents=include_documents)["credentials"]
 
-    def get_credential(self, credential_id):
-        """Get a specific credential by ID"""
+    def list_credentials(self, page=1, per_page=50, fields=None, status=None, include_documents=False, max_workers=8):
+        """
+        Paginated, field-projected registry listing.
+        Reads registry metadata only; IPFS documents are fetched (in parallel, for the requested page only)
+        when include_documents is set. page=None returns every matching entry.
+        """
+        entries = [
+            entry for entry in self.credentials_registry.values() if status is None or entry.get("status") == status
+        ]
+        total = len(entries)
+
+        if page is None:
+            page, per_page, pages = 1, total, 1
+        else:
+            page = max(1, int(page))
+            per_page = max(1, min(int(per_page), 500))
+            pages = (total + per_page - 1) // per_page
+            entries = entries[(page - 1) * per_page : page * per_page]
+
+        if fields:
+            projected = set(fields) | {"credential_id"}
+            items = [{key: entry.get(key) for key in projected} for entry in entries]
+        else:
+            items = [dict(entry) for entry in entries]
+
+        if include_documents and entries:
+            documents = self._fetch_documents([entry.get("ipfs_cid") for entry in entries], max_workers=max_workers)
+            for item, entry in zip(items, entries):
+                document = documents.get(entry.get("ipfs_cid"))
+                if document:
+                    item["full_credential"] = document.get("credentialSubject")
+
+        return {
+            "success": True,
+            "page": page,
+            "per_page": per_page,
+            "pages": pages,
+            "total": total,
+            "credentials": items,
+        }
+
+    def count_credentials_by_status(self):
+        """Status counts straight from registry metadata (no IPFS round trips)"""
+        counts = {"total": 0, "active": 0, "revoked": 0, "superseded": 0}
+        for entry in self.credentials_registry.values():
+            counts["total"] += 1
+            entry_status = entry.get("status", "active")
+            counts[entry_status] = counts.get(entry_status, 0) + 1
+        return counts
+
+    def _fetch_documents(self, cids, max_workers=8):
+        """Fetch distinct IPFS documents concurrently, returning {cid: document}"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        distinct = [cid for cid in dict.fromkeys(cids) if cid]
+        if not distinct:
+            return {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(distinct)))) as executor:
+            return dict(zip(distinct, executor.map(self.ipfs_client.get_json, distinct)))
+
+    def credential_exists(self, credential_id):
+        """Cheap existence check for unauthenticated lookups (Bloom filter, negative cache, then registry)"""
         credential_id = self._normalize_credential_id(credential_id)
+        if not self.existence_filter.might_exist(credential_id):
+            return False
         if credential_id in self.credentials_registry:
-            registry_entry = self.credentials_registry[credential_id]
+            return True
+        self.existence_filter.remember_missing(credential_id)
+        return False
+
+    def registry_revision(self, credential_id):
+        """Opaque marker that changes whenever the entry's document, status or version changes (None if unknown)"""
+        entry = self.credentials_registry.get(self._normalize_credential_id(credential_id))
+        if entry is None:
+            return None
+        return (entry.get("credential_hash"), entry.get("ipfs_cid"), entry.get("status"), entry.get("version"))
+
+    def get_credential(self, credential_id):
+        """Get a specific credential by ID (a copy with the IPFS document attached as full_credential)"""
+        credential_id = self._normalize_credential_id(credential_id)
+        registry_entry = self.credentials_registry.get(credential_id)
+        if registry_entry is not None:
+            registry_entry = dict(registry_entry)
             full_credential = self.ipfs_client.get_json(registry_entry["ipfs_cid"])
             if full_credential:
                 registry_entry["full_credential"] = full_credential
@@ -600,87 +1219,97 @@ class CredentialManager:
 
     def get_credentials_by_student(self, student_id):
         """Get all credentials for a specific student as a list"""
-        credentials = []
-        for cred_id, registry_entry in self.credentials_registry.items():
-            if registry_entry.get("student_id") == student_id:
-                credentials.append(registry_entry)
+        # Latest first for better UX in emails/dashboards (the version chain is already ordered)
+        registry = self.credentials_registry
+        return [registry[cred_id] for cred_id in self.version_index.versions(student_id) if cred_id in registry]
 
-        # Sort by version (latest first) for better UX in emails/dashboards
-        credentials.sort(key=lambda x: x.get("version", 1), reverse=True)
-        return credentials
+    def get_credential_lineage(self, credential_id):
+        """Walk a credential's version chain back to the first issuance: [this, previous, ..., v1]"""
+        credential_id = self._normalize_credential_id(credential_id)
+        registry = self.credentials_registry
+        return [registry[cred_id] for cred_id in self.version_index.lineage(credential_id) if cred_id in registry]
 
-    def get_credential_history(self, search_query):
-        """Get complete credential history for a student or by search query (all versions)"""
+    def get_credential_history(self, search_query, page=None, per_page=20):
+        """
+        Get complete credential history for a student or by search query (all versions).
+        Served from the n-gram search index: prefix/substring matches on student ID, name, credential ID,
+        degree, department, section and status. Without page, all matches are returned sorted by version;
+        with page, matches are ranked by relevance and paginated.
+        """
         try:
-            history = []
-            search_upper = str(search_query).strip().upper()
-            if search_upper in {"__ALL__", "ALL", "*"}:
-                search_upper = ""
-
-            for cred_id, registry_entry in self.credentials_registry.items():
-                match = False
-                c_id = str(cred_id).upper()
-                s_id = str(registry_entry.get("student_id", "")).upper()
-                s_name = str(registry_entry.get("student_name", "")).upper()
-                deg = str(registry_entry.get("degree", "")).upper()
-                dep = str(registry_entry.get("department", "")).upper()
-                sec = str(registry_entry.get("section", "")).upper()
-                status = str(registry_entry.get("status", "")).upper()
-
-                if (
-                    not search_upper
-                    or search_upper in s_id
-                    or search_upper in s_name
-                    or search_upper in c_id
-                    or search_upper in deg
-                    or search_upper in dep
-                    or search_upper in sec
-                    or search_upper in status
-                ):
-                    match = True
-
-                if match:
-                    history.append(registry_entry)
-
-            history.sort(key=lambda x: x.get("version", 1))
-
-            logging.info(f"Found {len(history)} credential version(s) for query '{search_query}'")
+            query = str(search_query).strip()
+            if query.upper() in {"__ALL__", "ALL", "*"}:
+                query = ""
 
-            return {
+            ranked = self.search_index.search(query)
+            total = len(ranked)
+
+            result = {
                 "success": True,
                 "search_query": search_query,
-                "total_versions": len(history),
-                "credentials": history,
+                "total_versions": total,
             }
 
+            registry = self.credentials_registry
+            if page is None:
+                history = [registry[cid] for cid, _ in ranked if cid in registry]
+                history.sort(key=lambda x: x.get("version", 1))
+            else:
+                page = max(1, int(page))
+                per_page = max(1, min(int(per_page), 200))
+                window = ranked[(page - 1) * per_page : page * per_page]
+                history = [dict(registry[cid], search_score=score) for cid, score in window if cid in registry]
+                result.update({"page": page, "per_page": per_page, "pages": (total + per_page - 1) // per_page})
+
+            logging.info(f"Found {total} credential version(s) for query '{search_query}'")
+
+            result["credentials"] = history
+            return result
+
         except Exception as e:
             logging.error(f"Error getting credential history: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    def reset_registry(self):
+        """Clear the in-memory registry and every structure derived from it (system reset)"""
+        with self._registry_lock:
+            self.credentials_registry = {}
+            self._reserved_versions = {}
+        self.search_index.rebuild(self.credentials_registry)
+        self.version_index.rebuild(self.credentials_registry)
+        self.existence_filter.rebuild(self.credentials_registry)
+        self.document_mirror.forget_all()
+        self.status_list.rebuild(self.credentials_registry)
+
     def revoke_credential(self, credential_id, reason="", reason_category="other"):
         """Revoke a credential (mark as revoked)"""
         try:
             credential_id = self._normalize_credential_id(credential_id)
-            if credential_id not in self.credentials_registry:
-                return {"success": False, "error": "Credential not found"}
+            with self._registry_lock:
+                registry_entry = self.credentials_registry.get(credential_id)
+                if registry_entry is None:
+                    return {"success": False, "error": "Credential not found"}
 
-            current_status = self.credentials_registry[credential_id].get("status")
+                current_status = registry_entry.get("status")
 
-            if current_status == "superseded":
-                return {
-                    "success": False,
-                    "error": "Cannot revoke superseded credential. Revoke the active version instead.",
-                }
+                if current_status == "superseded":
+                    return {
+                        "success": False,
+                        "error": "Cannot revoke superseded credential. Revoke the active version instead.",
+                    }
 
-            if current_status == "revoked":
-                return {"success": False, "error": "Credential is already revoked"}
+                if current_status == "revoked":
+                    return {"success": False, "error": "Credential is already revoked"}
 
-            revoked_at = datetime.utcnow().isoformat() + "Z"
+                revoked_at = datetime.utcnow().isoformat() + "Z"
 
-            self.credentials_registry[credential_id]["status"] = "revoked"
-            self.credentials_registry[credential_id]["revoked_at"] = revoked_at
-            self.credentials_registry[credential_id]["revocation_reason"] = reason
-            self.credentials_registry[credential_id]["revocation_category"] = reason_category
+                self._update_registry_entry(
+                    credential_id,
+                    status="revoked",
+                    revoked_at=revoked_at,
+                    revocation_reason=reason,
+                    revocation_category=reason_category,
+                )
 
             revocation_data = {
                 "credential_id": credential_id,
@@ -702,12 +1331,221 @@ class CredentialManager:
                 "message": "Credential revoked successfully",
                 "revocation_block": block.hash,
                 "revoked_at": revoked_at,
+                "student_id": registry_entry.get("student_id"),
+                "degree": registry_entry.get("degree"),
             }
 
         except Exception as e:
             logging.error(f"Error revoking credential: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    MAX_BATCH_REVOCATIONS = 1000
+
+    def revoke_credentials_batch(self, credential_ids, reason="", reason_category="other"):
+        """
+        Revoke many credentials at once: every target is validated, the valid ones are revoked in a
+        single registry swap, anchored in ONE credential_revocation_batch block and persisted once.
+        Returns per-item results (invalid targets are reported, not fatal).
+        """
+        try:
+            ordered_ids = []
+            for credential_id in credential_ids or []:
+                credential_id = self._normalize_credential_id(credential_id)
+                if credential_id and credential_id not in ordered_ids:
+                    ordered_ids.append(credential_id)
+
+            if not ordered_ids:
+                return {"success": False, "error": "No credential IDs provided"}
+            if len(ordered_ids) > self.MAX_BATCH_REVOCATIONS:
+                return {"success": False, "error": f"Too many credentials (max {self.MAX_BATCH_REVOCATIONS})"}
+
+            revoked_at = datetime.utcnow().isoformat() + "Z"
+            results = []
+            changes = {}
+
+            with self._registry_lock:
+                registry = self.credentials_registry
+                for credential_id in ordered_ids:
+                    registry_entry = registry.get(credential_id)
+                    if registry_entry is None:
+                        error = "Credential not found"
+                    elif registry_entry.get("status") == "superseded":
+                        error = "Cannot revoke superseded credential. Revoke the active version instead."
+                    elif registry_entry.get("status") == "revoked":
+                        error = "Credential is already revoked"
+                    else:
+                        error = None
+
+                    if error:
+                        results.append({"credential_id": credential_id, "success": False, "error": error})
+                        continue
+
+                    changes[credential_id] = dict(
+                        registry_entry,
+                        status="revoked",
+                        revoked_at=revoked_at,
+                        revocation_reason=reason,
+                        revocation_category=reason_category,
+                    )
+                    results.append(
+                        {
+                            "credential_id": credential_id,
+                            "success": True,
+                            "student_id": registry_entry.get("student_id"),
+                            "degree": registry_entry.get("degree"),
+                        }
+                    )
+
+                self._publish_registry(changes)
+
+            if not changes:
+                return {
+                    "success": False,
+                    "error": "None of the credentials could be revoked",
+                    "revoked": 0,
+                    "failed": len(results),
+                    "results": results,
+                }
+
+            block = self.blockchain.add_block(
+                {
+                    "type": "credential_revocation_batch",
+                    "credential_ids": list(changes),
+                    "reason": reason,
+                    "reason_category": reason_category,
+                    "revoked_at": revoked_at,
+                    "revoked_by": "issuer",
+                }
+            )
+
+            self.save_credentials_registry()
+
+            logging.info(
+                f"Batch revoked {len(changes)} credential(s) in block #{block.index} - Reason: {reason_category}"
+            )
+
+            return {
+                "success": True,
+                "message": f"{len(changes)} credential(s) revoked",
+                "revocation_block": block.hash,
+                "revoked_at": revoked_at,
+                "revoked": len(changes),
+                "failed": len(results) - len(changes),
+                "results": results,
+            }
+
+        except Exception as e:
+            logging.error(f"Error batch revoking credentials: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    # ==================== BULK EXPORT / IMPORT ====================
+    EXPORT_CHUNK_SIZE = 64 * 1024
+    IMPORT_REQUIRED_FIELDS = ("credential_id", "ipfs_cid", "credential_hash")
+
+    def export_registry(self, compress=False, status=None):
+        """
+        Stream the registry as NDJSON (one entry per line), optionally as a gzip stream.
+        Works from one registry snapshot and yields ~64KB chunks, so memory stays flat.
+        """
+        registry = self.credentials_registry
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None
+        buffer, buffered = [], 0
+
+        for registry_entry in registry.values():
+            if status is not None and registry_entry.get("status") != status:
+                continue
+            line = (json.dumps(registry_entry, separators=(",", ":")) + "\n").encode("utf-8")
+            buffer.append(line)
+            buffered += len(line)
+            if buffered >= self.EXPORT_CHUNK_SIZE:
+                chunk = b"".join(buffer)
+                buffer, buffered = [], 0
+                chunk = compressor.compress(chunk) if compressor else chunk
+                if chunk:
+                    yield chunk
+
+        chunk = b"".join(buffer)
+        if compressor:
+            chunk = compressor.compress(chunk) + compressor.flush()
+        if chunk:
+            yield chunk
+
+    def _iter_ndjson_rows(self, source, compressed=None):
+        """Lines from an iterable or a binary file object (gzip auto-detected when the file is seekable)"""
+        if hasattr(source, "read"):
+            if compressed is None and getattr(source, "seekable", lambda: False)():
+                compressed = source.read(2) == b"\x1f\x8b"
+                source.seek(0)
+            if compressed:
+                source = gzip.GzipFile(fileobj=source)
+        for line in source:
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            line = line.strip()
+            if line:
+                yield line
+
+    def import_registry(self, source, batch_size=500, overwrite=False, compressed=None):
+        """
+        Apply NDJSON registry rows (export_registry format) in batches.
+        Each batch is published as one copy-on-write swap and the registry file is saved once at the end.
+        Existing credentials are skipped unless overwrite is set. Rows whose status_list_index already
+        belongs to another credential are rejected: sharing a bit would let one revocation flip both.
+        """
+        imported, skipped, errors = 0, 0, []
+        batch = {}
+        claimed = {}  # status index -> credential_id, for rows not published yet
+
+        def apply_batch():
+            nonlocal batch
+            if batch:
+                self._publish_registry(batch)
+                batch = {}
+
+        try:
+            for line_number, line in enumerate(self._iter_ndjson_rows(source, compressed), start=1):
+                try:
+                    registry_entry = json.loads(line)
+                    missing = [field for field in self.IMPORT_REQUIRED_FIELDS if not registry_entry.get(field)]
+                    if missing:
+                        raise ValueError(f"missing {', '.join(missing)}")
+                    credential_id = registry_entry["credential_id"]
+                    if not overwrite and (credential_id in self.credentials_registry or credential_id in batch):
+                        skipped += 1
+                        continue
+                    status_index = registry_entry.get("status_list_index")
+                    if status_index is not None:
+                        status_index = int(status_index)
+                        owner = claimed.get(status_index) or self.status_list.owner(status_index)
+                        if owner not in (None, credential_id):
+                            raise ValueError(f"status_list_index {status_index} is already used by {owner}")
+                        claimed[status_index] = credential_id
+                except (ValueError, TypeError, AttributeError) as e:
+                    errors.append(f"line {line_number}: {str(e)}")
+                    continue
+
+                batch[credential_id] = registry_entry
+                imported += 1
+                if len(batch) >= batch_size:
+                    apply_batch()
+
+            apply_batch()
+        except Exception as e:
+            logging.error(f"Registry import error: {str(e)}")
+            return {"success": False, "error": str(e), "imported": imported}
+        finally:
+            if imported:
+                self.save_credentials_registry()
+
+        logging.info(f"Registry import: {imported} imported, {skipped} skipped, {len(errors)} invalid row(s)")
+        return {
+            "success": True,
+            "imported": imported,
+            "skipped": skipped,
+            "error_count": len(errors),
+            "errors": errors[:20],
+        }
+
     def load_credentials_registry(self):
         """Load credentials registry from data/ folder"""
         try:
@@ -717,7 +1555,10 @@ class CredentialManager:
                 with open(self.credentials_file, "r") as f:
                     registry = json.load(f)
                     logging.info(f"Credentials registry loaded: {len(registry)} entries")
-                    return registry
+                    return {
+                        credential_id: self.course_catalog.intern_entry(registry_entry)
+                        for credential_id, registry_entry in registry.items()
+                    }
             else:
                 logging.info(f"No existing credentials registry found")
                 return {}
@@ -726,13 +1567,17 @@ class CredentialManager:
             return {}
 
     def save_credentials_registry(self):
-        """Save credentials registry to data/ folder"""
+        """Save credentials registry to data/ folder (atomic replace, so readers never see a torn file)"""
         try:
             DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-            with open(self.credentials_file, "w") as f:
-                json.dump(self.credentials_registry, f, indent=2)
-            logging.info(f"Credentials registry saved: {len(self.credentials_registry)} entries")
+            with self._registry_lock:
+                registry = self.credentials_registry
+                tmp_file = self.credentials_file.with_name(self.credentials_file.name + ".tmp")
+                with open(tmp_file, "w") as f:
+                    json.dump(registry, f, indent=2)
+                os.replace(tmp_file, self.credentials_file)
+            logging.info(f"Credentials registry saved: {len(registry)} entries")
         except Exception as e:
             logging.error(f"Error saving credentials registry: {str(e)}")
 
@@ -3,28 +3,156 @@ import json
 import base64
 import hashlib
 import logging
+import secrets
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
+from cryptography.hazmat.primitives.asymmetric import rsa, padding, ec, ed25519
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature, encode_dss_signature
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
 
 # FIXED: Import DATA_DIR from core package [web:42]
 from . import DATA_DIR, PROJECT_ROOT
+from .canonical import CanonicalDocument
+from .merkle import MerkleTree
 
 logging.basicConfig(level=logging.INFO)
 
+try:
+    import fcntl
+except ImportError:  # Windows: provisioning is single-flight per process only
+    fcntl = None
+
+
+@contextmanager
+def _file_lock(path):
+    """Exclusive advisory lock on `path` (held across processes)"""
+    if fcntl is None:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _write_atomic(path, data):
+    """Write JSON via a temp file + rename so other processes never read a half-written key file"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
 
 class CryptoManager:
     """Handles cryptographic operations for verifiable credentials"""
 
-    def __init__(self):
+    # JOSE algorithm -> (aliases, credential proof type). PS256 is the legacy RSA-4096 issuer key.
+    ALGORITHMS = {
+        "PS256": (("rsa", "rsa-pss", "ps256"), "RsaSignature2018"),
+        "EdDSA": (("ed25519", "eddsa"), "Ed25519Signature2020"),
+        "ES256": (("ecdsa", "p-256", "p256", "es256"), "EcdsaSecp256r1Signature2019"),
+    }
+
+    def __init__(self, signing_algorithm=None):
         # FIXED: Use DATA_DIR instead of relative path [web:72]
         self.key_file = DATA_DIR / "issuer_keys.pem"
-        self.private_key = None
-        self.public_key = None
-        self.load_or_generate_keys()
+        self.keyring_file = DATA_DIR / "issuer_keyring.json"
+        self.lock_file = DATA_DIR / "issuer_keys.lock"
+        # Keys are provisioned lazily (first use, or provision_async at startup) so importing the app
+        # never waits on RSA-4096 generation
+        self._private_key = None
+        self._public_key = None
+        self._keys = {}  # kid -> {kid, alg, private_key, public_key}
+        self._legacy_kid = None
+        self._active_kid = None
+        self._signing_algorithm = self._resolve_algorithm(
+            signing_algorithm or os.environ.get("SIGNING_ALGORITHM", "PS256")
+        )
+        self._ready = threading.Event()
+        self._provision_lock = threading.Lock()
+        # Guards _active_kid only; never held while keys are generated, so selecting an algorithm never blocks
+        self._algorithm_lock = threading.Lock()
+        self._provision_thread = None
+        self.signer = None  # Optional core.signing_service.SigningService (process-pool signing)
+        # Positive-only verification memo: sha256(kid, message digest, signature) -> None, in LRU order
+        self.verify_cache_size = 65536
+        self._verified = OrderedDict()
+        self._verified_lock = threading.Lock()
+        self._verify_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    # ==================== LAZY PROVISIONING ====================
+    def ensure_ready(self):
+        """Load (or generate) every issuer key exactly once; concurrent callers wait for the same run"""
+        if self._ready.is_set():
+            return
+        with self._provision_lock:
+            if self._ready.is_set():
+                return
+            # The file lock makes generation single-flight across worker processes too: the losers
+            # find the winner's key files once they get the lock
+            with _file_lock(self.lock_file):
+                self.load_or_generate_keys()
+                self.load_or_generate_keyring()
+            self._apply_signing_algorithm()
+            self._ready.set()
+
+    def provision_async(self):
+        """Start provisioning in the background (idempotent); returns immediately"""
+        with self._provision_lock:
+            if self._ready.is_set() or (self._provision_thread and self._provision_thread.is_alive()):
+                return
+            self._provision_thread = threading.Thread(target=self._provision_in_background, daemon=True)
+            self._provision_thread.start()
+
+    def _provision_in_background(self):
+        try:
+            self.ensure_ready()
+        except Exception as e:
+            logging.error(f"Issuer key provisioning failed: {str(e)}")
+
+    @property
+    def is_ready(self):
+        return self._ready.is_set()
+
+    def wait_ready(self, timeout=None):
+        return self._ready.wait(timeout)
+
+    @property
+    def private_key(self):
+        self.ensure_ready()
+        return self._private_key
+
+    @property
+    def public_key(self):
+        self.ensure_ready()
+        return self._public_key
+
+    @property
+    def keys(self):
+        self.ensure_ready()
+        return self._keys
+
+    @property
+    def legacy_kid(self):
+        self.ensure_ready()
+        return self._legacy_kid
+
+    @property
+    def active_kid(self):
+        self.ensure_ready()
+        if self._keys[self._active_kid]["alg"] != self._signing_algorithm:
+            # The algorithm was changed while provisioning was still running
+            self._apply_signing_algorithm()
+        return self._active_kid
 
     def load_or_generate_keys(self):
         """Load existing keys or generate new ones"""
@@ -44,11 +172,11 @@ class CryptoManager:
 
     def generate_keys(self):
         """Generate new RSA key pair (Upgraded to 4096 bits for Phase 4)"""
-        self.private_key = rsa.generate_private_key(
+        self._private_key = rsa.generate_private_key(
             public_exponent=65537,
             key_size=4096,  # UPGRADED
         )
-        self.public_key = self.private_key.public_key()
+        self._public_key = self._private_key.public_key()
         self.save_keys()
 
     def save_keys(self):
@@ -57,20 +185,19 @@ class CryptoManager:
             # FIXED: Ensure data directory exists
             DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-            private_pem = self.private_key.private_bytes(
+            private_pem = self._private_key.private_bytes(
                 encoding=serialization.Encoding.PEM,
                 format=serialization.PrivateFormat.PKCS8,
                 encryption_algorithm=serialization.NoEncryption(),
             )
 
-            public_pem = self.public_key.public_bytes(
+            public_pem = self._public_key.public_bytes(
                 encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo
             )
 
             keys_data = {"private_key": private_pem.decode("utf-8"), "public_key": public_pem.decode("utf-8")}
 
-            with open(self.key_file, "w") as f:
-                json.dump(keys_data, f, indent=2)
+            _write_atomic(self.key_file, keys_data)
             logging.info(f"Cryptographic keys saved to {self.key_file}")
         except Exception as e:
             logging.error(f"Error saving keys: {str(e)}")
@@ -85,51 +212,286 @@ class CryptoManager:
             private_pem = keys_data["private_key"].encode("utf-8")
             public_pem = keys_data["public_key"].encode("utf-8")
 
-            self.private_key = load_pem_private_key(private_pem, password=None)
-            self.public_key = load_pem_public_key(public_pem)
+            self._private_key = load_pem_private_key(private_pem, password=None)
+            self._public_key = load_pem_public_key(public_pem)
             logging.info(f"Keys loaded successfully from {self.key_file}")
         except Exception as e:
             logging.error(f"Error loading keys from {self.key_file}: {str(e)}")
             raise
 
-    def sign_data(self, data):
-        """Sign data with private key"""
+    # ==================== KEYRING (kid-tagged keys) ====================
+    # Signatures made with a keyring key are "<kid>:<base64>"; untagged signatures are legacy RSA-PSS.
+
+    @staticmethod
+    def _key_id(alg, public_key):
+        public_der = public_key.public_bytes(
+            encoding=serialization.Encoding.DER, format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        prefix = {"PS256": "rsa", "EdDSA": "ed25519", "ES256": "p256"}[alg]
+        return f"{prefix}-{hashlib.sha256(public_der).hexdigest()[:12]}"
+
+    def _register_key(self, alg, private_key):
+        public_key = private_key.public_key()
+        kid = self._key_id(alg, public_key)
+        self._keys[kid] = {"kid": kid, "alg": alg, "private_key": private_key, "public_key": public_key}
+        return kid
+
+    def load_or_generate_keyring(self):
+        """
+        Load the Ed25519 / P-256 keys next to the RSA key, generating any that are missing.
+
+        An existing keyring that cannot be read is never replaced, since its keys back signatures already
+        issued: provisioning fails (and nothing is signed) until the file is repaired.
+        """
+        self._keys = {}
+        self._legacy_kid = self._register_key("PS256", self._private_key)
+        if self.keyring_file.exists():
+            try:
+                with open(self.keyring_file, "r") as f:
+                    for record in json.load(f)["keys"]:
+                        if record["alg"] not in self.ALGORITHMS or record["alg"] == "PS256":
+                            raise ValueError(f"unsupported key algorithm {record['alg']!r}")
+                        private_key = load_pem_private_key(record["private_key"].encode("utf-8"), password=None)
+                        self._register_key(record["alg"], private_key)
+            except Exception as e:
+                logging.error(f"Error loading issuer keyring {self.keyring_file}: {str(e)}")
+                raise RuntimeError(f"Issuer keyring {self.keyring_file} is unreadable; refusing to replace it") from e
+
+        present = {entry["alg"] for entry in self._keys.values()}
+        generated = False
+        if "EdDSA" not in present:
+            self._register_key("EdDSA", ed25519.Ed25519PrivateKey.generate())
+            generated = True
+        if "ES256" not in present:
+            self._register_key("ES256", ec.generate_private_key(ec.SECP256R1()))
+            generated = True
+        if generated:
+            self.save_keyring()
+
+    def save_keyring(self):
         try:
-            if isinstance(data, dict):
-                data_string = json.dumps(data, sort_keys=True)
-            else:
-                data_string = str(data)
+            DATA_DIR.mkdir(parents=True, exist_ok=True)
+            records = [
+                {
+                    "kid": entry["kid"],
+                    "alg": entry["alg"],
+                    "private_key": entry["private_key"]
+                    .private_bytes(
+                        encoding=serialization.Encoding.PEM,
+                        format=serialization.PrivateFormat.PKCS8,
+                        encryption_algorithm=serialization.NoEncryption(),
+                    )
+                    .decode("utf-8"),
+                }
+                for entry in self._keys.values()
+                if entry["alg"] != "PS256"  # The RSA key lives in issuer_keys.pem
+            ]
+            _write_atomic(self.keyring_file, {"keys": records})
+            logging.info(f"Issuer keyring saved to {self.keyring_file}")
+        except Exception as e:
+            logging.error(f"Error saving issuer keyring: {str(e)}")
+
+    def _resolve_algorithm(self, algorithm):
+        name = str(algorithm or "").strip()
+        for alg, (aliases, _) in self.ALGORITHMS.items():
+            if name == alg or name.lower() in aliases:
+                return alg
+        raise ValueError(f"Unsupported signing algorithm: {algorithm}")
+
+    def _apply_signing_algorithm(self):
+        with self._algorithm_lock:
+            alg = self._signing_algorithm
+            self._active_kid = next(kid for kid, entry in self._keys.items() if entry["alg"] == alg)
+        logging.info(f"Signing with {alg} key {self._active_kid}")
+
+    def set_signing_algorithm(self, algorithm):
+        """Choose the key used for new signatures (existing signatures of every key stay verifiable)"""
+        self.signing_algorithm = algorithm
+        return self.active_kid
+
+    @property
+    def signing_algorithm(self):
+        return self._signing_algorithm
+
+    @signing_algorithm.setter
+    def signing_algorithm(self, algorithm):
+        """Select the algorithm without provisioning keys or waiting for a provisioning run (applied once keys exist)"""
+        self._signing_algorithm = self._resolve_algorithm(algorithm)
+        if self._ready.is_set():
+            self._apply_signing_algorithm()
+
+    @property
+    def proof_type(self):
+        """Credential proof type for the active key"""
+        return self.ALGORITHMS[self.signing_algorithm][1]
 
-            data_bytes = data_string.encode("utf-8")
+    @staticmethod
+    def _raw_sign(entry, data_bytes, pss_salt_length=None):
+        alg = entry["alg"]
+        if alg == "EdDSA":
+            return entry["private_key"].sign(data_bytes)
+        if alg == "ES256":
+            r, s = decode_dss_signature(entry["private_key"].sign(data_bytes, ec.ECDSA(hashes.SHA256())))
+            return r.to_bytes(32, "big") + s.to_bytes(32, "big")  # JOSE-style fixed-size r || s
+        if pss_salt_length is None:
+            pss_salt_length = padding.PSS.MAX_LENGTH
+        return entry["private_key"].sign(
+            data_bytes, padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=pss_salt_length), hashes.SHA256()
+        )
 
-            signature = self.private_key.sign(
+    @staticmethod
+    def _raw_verify(entry, signature_bytes, data_bytes, pss_salt_length=padding.PSS.MAX_LENGTH):
+        """Raises on an invalid signature"""
+        alg = entry["alg"]
+        if alg == "EdDSA":
+            entry["public_key"].verify(signature_bytes, data_bytes)
+        elif alg == "ES256":
+            if len(signature_bytes) != 64:
+                raise ValueError("Invalid ES256 signature length")
+            der = encode_dss_signature(
+                int.from_bytes(signature_bytes[:32], "big"), int.from_bytes(signature_bytes[32:], "big")
+            )
+            entry["public_key"].verify(der, data_bytes, ec.ECDSA(hashes.SHA256()))
+        else:
+            entry["public_key"].verify(
+                signature_bytes,
                 data_bytes,
-                padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH),
+                padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=pss_salt_length),
                 hashes.SHA256(),
             )
 
-            return base64.b64encode(signature).decode("utf-8")
+    def signature_key_id(self, signature):
+        """kid that produced a signature (untagged signatures belong to the legacy RSA key)"""
+        kid, _, _ = str(signature or "").rpartition(":")
+        return kid or self.legacy_kid
+
+    def proof_type_for(self, kid):
+        return self.ALGORITHMS[self.keys[kid]["alg"]][1]
+
+    def get_public_keys(self):
+        """Every issuer key (legacy RSA included) for key discovery"""
+        return [
+            {
+                "kid": entry["kid"],
+                "algorithm": entry["alg"],
+                "proofType": self.ALGORITHMS[entry["alg"]][1],
+                "active": entry["kid"] == self.active_kid,
+                "legacy": entry["kid"] == self.legacy_kid,
+                "publicKeyPem": entry["public_key"]
+                .public_bytes(
+                    encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo
+                )
+                .decode("utf-8"),
+            }
+            for entry in self.keys.values()
+        ]
+
+    @staticmethod
+    def _signing_bytes(data):
+        """Bytes covered by sign_data/verify_signature (a CanonicalDocument reuses its cached sorted form)"""
+        if isinstance(data, CanonicalDocument):
+            return data.sorted_bytes
+        if isinstance(data, bytes):
+            return data
+        if isinstance(data, dict):
+            return json.dumps(data, sort_keys=True).encode("utf-8")
+        return str(data).encode("utf-8")
+
+    def _sign(self, entry, data_bytes, pss_salt_length=None):
+        """Private-key operation, offloaded to the signing service when one is attached"""
+        if self.signer is not None:
+            return self.signer.sign(entry["kid"], data_bytes, pss_salt_length)
+        return self._raw_sign(entry, data_bytes, pss_salt_length)
+
+    def _format_signature(self, kid, raw_signature):
+        signature = base64.b64encode(raw_signature).decode("utf-8")
+        return signature if kid == self.legacy_kid else f"{kid}:{signature}"
+
+    def sign_data(self, data):
+        """Sign data with the active key ("<kid>:<base64>"; legacy RSA signatures stay untagged base64)"""
+        try:
+            data_bytes = self._signing_bytes(data)
+            kid = self.active_kid
+            return self._format_signature(kid, self._sign(self.keys[kid], data_bytes))
         except Exception as e:
             logging.error(f"Error signing data: {str(e)}")
             return None
 
-    def verify_signature(self, data, signature):
-        """Verify signature with public key"""
+    def sign_data_async(self, data):
+        """Future resolving to sign_data(data) (None on failure); the caller can do other work until it needs it"""
+        result = Future()
         try:
-            if isinstance(data, dict):
-                data_string = json.dumps(data, sort_keys=True)
-            else:
-                data_string = str(data)
+            kid = self.active_kid
+            data_bytes = self._signing_bytes(data)
+            if self.signer is None:
+                result.set_result(self._format_signature(kid, self._raw_sign(self.keys[kid], data_bytes)))
+                return result
+            pending = self.signer.submit(kid, data_bytes)
+        except Exception as e:
+            logging.error(f"Error signing data: {str(e)}")
+            result.set_result(None)
+            return result
 
-            data_bytes = data_string.encode("utf-8")
-            signature_bytes = base64.b64decode(signature.encode("utf-8"))
+        def done(pending):
+            try:
+                result.set_result(self._format_signature(kid, pending.result()))
+            except Exception as e:
+                logging.error(f"Error signing data: {str(e)}")
+                result.set_result(None)
 
-            self.public_key.verify(
-                signature_bytes,
-                data_bytes,
-                padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH),
-                hashes.SHA256(),
-            )
+        pending.add_done_callback(done)
+        return result
+
+    # ==================== VERIFICATION MEMO ====================
+    # Blocks, credential proofs and QR tokens are immutable and re-verified constantly; a verified
+    # (key, message, signature) triple is remembered so the next check costs a hash. Failures are never cached.
+
+    @staticmethod
+    def _memo_key(kid, data_bytes, signature_bytes):
+        return hashlib.sha256(
+            kid.encode("utf-8") + b"\0" + hashlib.sha256(data_bytes).digest() + signature_bytes
+        ).digest()
+
+    def _memo_hit(self, memo_key):
+        with self._verified_lock:
+            if memo_key in self._verified:
+                self._verified.move_to_end(memo_key)
+                self._verify_cache_stats["hits"] += 1
+                return True
+            self._verify_cache_stats["misses"] += 1
+            return False
+
+    def _memo_store(self, memo_key):
+        with self._verified_lock:
+            self._verified[memo_key] = None
+            while len(self._verified) > self.verify_cache_size:
+                self._verified.popitem(last=False)
+                self._verify_cache_stats["evictions"] += 1
+
+    def verify_cache_info(self):
+        """Hit ratio / eviction counters of the verification memo"""
+        with self._verified_lock:
+            stats = dict(self._verify_cache_stats, size=len(self._verified), max_size=self.verify_cache_size)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+    def clear_verify_cache(self):
+        with self._verified_lock:
+            self._verified.clear()
+
+    def verify_signature(self, data, signature):
+        """Verify a signature, dispatching on its kid tag (untagged = legacy RSA-PSS key)"""
+        try:
+            data_bytes = self._signing_bytes(data)
+            kid, _, encoded = signature.rpartition(":")
+            entry = self.keys[kid or self.legacy_kid]
+            signature_bytes = base64.b64decode(encoded.encode("utf-8"))
+            memo_key = self._memo_key(entry["kid"], data_bytes, signature_bytes)
+            if self._memo_hit(memo_key):
+                return True
+            self._raw_verify(entry, signature_bytes, data_bytes)
+            self._memo_store(memo_key)
             return True
         except Exception as e:
             logging.debug(f"Signature verification failed: {str(e)}")
@@ -151,7 +513,10 @@ class CryptoManager:
     def sign_jws(self, data):
         """Create a JWS-compact style signature (Header.Payload.Signature)"""
         try:
-            header = {"alg": "PS256", "typ": "JWS"}
+            entry = self.keys[self.active_kid]
+            header = {"alg": entry["alg"], "typ": "JWS"}
+            if entry["kid"] != self.legacy_kid:
+                header["kid"] = entry["kid"]
             header_b64 = base64.urlsafe_b64encode(self._compact_json(header).encode()).decode().rstrip("=")
 
             if isinstance(data, dict):
@@ -162,11 +527,7 @@ class CryptoManager:
 
             signing_input = f"{header_b64}.{payload_b64}"
 
-            signature = self.private_key.sign(
-                signing_input.encode(),
-                padding.PSS(mgf=padding.MGF1(self._jws_hash_algorithm()), salt_length=self._jws_standard_salt_length()),
-                self._jws_hash_algorithm(),
-            )
+            signature = self._sign(entry, signing_input.encode(), self._jws_standard_salt_length())
             signature_b64 = base64.urlsafe_b64encode(signature).decode().rstrip("=")
 
             return f"{header_b64}.{payload_b64}.{signature_b64}"
@@ -191,15 +552,25 @@ class CryptoManager:
             signature = base64.urlsafe_b64decode(pad_b64(signature_b64))
             payload_json = json.loads(base64.urlsafe_b64decode(pad_b64(payload_b64)).decode())
 
+            # Dispatch on the header: kid-tagged tokens name their key, legacy tokens are PS256
+            header = json.loads(base64.urlsafe_b64decode(pad_b64(header_b64)).decode())
+            entry = self.keys[header.get("kid") or self.legacy_kid]
+            if header.get("alg", "PS256") != entry["alg"]:
+                raise ValueError("JWS alg does not match the key")
+            # The header (alg/kid) is part of the signing input, so it is covered by the memo key
+            memo_key = self._memo_key(f"jws:{entry['kid']}", signing_input.encode(), signature)
+            if self._memo_hit(memo_key):
+                return True, payload_json
+            if entry["alg"] != "PS256":
+                self._raw_verify(entry, signature, signing_input.encode())
+                self._memo_store(memo_key)
+                return True, payload_json
+
             last_error = None
             for salt_length in (self._jws_standard_salt_length(), padding.PSS.MAX_LENGTH):
                 try:
-                    self.public_key.verify(
-                        signature,
-                        signing_input.encode(),
-                        padding.PSS(mgf=padding.MGF1(self._jws_hash_algorithm()), salt_length=salt_length),
-                        self._jws_hash_algorithm(),
-                    )
+                    self._raw_verify(entry, signature, signing_input.encode(), salt_length)
+                    self._memo_store(memo_key)
                     return True, payload_json
                 except Exception as verify_error:
                     last_error = verify_error
@@ -211,12 +582,7 @@ class CryptoManager:
 
     def hash_data(self, data):
         """Create SHA-256 hash of data"""
-        if isinstance(data, dict):
-            data_string = json.dumps(data, sort_keys=True)
-        else:
-            data_string = str(data)
-
-        return hashlib.sha256(data_string.encode("utf-8")).hexdigest()
+        return hashlib.sha256(self._signing_bytes(data)).hexdigest()
 
     def get_public_key_pem(self):
         """Get public key in PEM format"""
@@ -225,55 +591,152 @@ class CryptoManager:
         )
         return public_pem.decode("utf-8")
 
+    def create_merkle_tree(self, leaf_hashes):
+        """Bytes-native MerkleTree over the sorted hex leaf hashes (roots match the hex-string construction)"""
+        return MerkleTree.from_hex(sorted(leaf_hashes))
+
+    def create_merkle_levels(self, leaf_hashes):
+        """
+        Build every level of the Merkle tree (leaves first, root last) as hex strings.
+        Leaves are sorted and odd levels duplicate their last node, matching create_merkle_root.
+        """
+        if not leaf_hashes:
+            return []
+        return self.create_merkle_tree(leaf_hashes).levels_hex()
+
     def create_merkle_root(self, leaf_hashes):
         """
         Create Merkle root from a list of hashes.
         Leaf hashes should be pre-computed.
         """
-        if not leaf_hashes:
-            return None
+        return self.create_merkle_tree(leaf_hashes).root_hex if leaf_hashes else None
 
-        current_hashes = sorted(leaf_hashes)  # Sort for consistency
+    def create_merkle_path(self, levels, leaf_hash):
+        """
+        Inclusion path for a leaf: [{"hash": sibling, "position": "left"|"right"}, ...] from leaf to root.
+        `levels` is a MerkleTree (O(log n)) or hex level lists from create_merkle_levels.
+        """
+        if isinstance(levels, MerkleTree):
+            steps = levels.proof(levels.index_of(bytes.fromhex(leaf_hash)))
+            return [{"hash": sibling.hex(), "position": "left" if is_left else "right"} for sibling, is_left in steps]
+
+        index = levels[0].index(leaf_hash)
+        path = []
+        for level in levels[:-1]:
+            if index % 2:
+                path.append({"hash": level[index - 1], "position": "left"})
+            else:
+                sibling = level[index + 1] if index + 1 < len(level) else level[index]
+                path.append({"hash": sibling, "position": "right"})
+            index //= 2
+        return path
 
-        while len(current_hashes) > 1:
-            next_level = []
-            for i in range(0, len(current_hashes), 2):
-                if i + 1 < len(current_hashes):
-                    combined = current_hashes[i] + current_hashes[i + 1]
-                else:
-                    combined = current_hashes[i] + current_hashes[i]  # Duplicate if odd number
-                next_level.append(self.hash_data(combined))
-            current_hashes = next_level
+    def verify_merkle_path(self, leaf_hash, path, merkle_root):
+        """Recompute the root from a leaf and its inclusion path"""
+        try:
+            steps = [(bytes.fromhex(step["hash"]), step["position"] == "left") for step in path]
+            return MerkleTree.verify_proof(bytes.fromhex(leaf_hash), steps, bytes.fromhex(merkle_root))
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    # ==================== BATCH SIGNING ====================
+    # One signature over the Merkle root of N document hashes; each document carries its inclusion path.
 
-        return current_hashes[0]
+    BATCH_PROOF_TYPE = "MerkleProof2019"
 
-    def create_proof_for_fields(self, all_fields, selected_fields, field_salts):
+    @staticmethod
+    def _batch_root_message(merkle_root):
+        # Domain-separated so a root signature can never double as a block-hash signature
+        return f"credential-batch:{merkle_root}"
+
+    def sign_batch(self, documents):
         """
-        Create a ELITE salted Merkle proof for selective disclosure using PRE-STORED salts.
-        Collision-safe construction: hash(salt + "|" + field + "|" + value)
+        Sign many documents with a single private-key operation.
+        Returns one {"merkleRoot", "merklePath", "signatureValue"} per document (same order), or None on failure.
         """
-        import secrets
+        leaves = [self.hash_data(document) for document in documents]
+        if not leaves:
+            return []
+        tree = self.create_merkle_tree(leaves)
+        merkle_root = tree.root_hex
+        signature = self.sign_data(self._batch_root_message(merkle_root))
+        if not signature:
+            return None
+        return [
+            {
+                "merkleRoot": merkle_root,
+                "merklePath": self.create_merkle_path(tree, leaf),
+                "signatureValue": signature,
+            }
+            for leaf in leaves
+        ]
+
+    def verify_batch_proof(self, data, proof):
+        """Document hash -> inclusion path -> signed root"""
+        try:
+            merkle_root = proof["merkleRoot"]
+            if not self.verify_merkle_path(self.hash_data(data), proof["merklePath"], merkle_root):
+                return False
+            return self.verify_signature(self._batch_root_message(merkle_root), proof["signatureValue"])
+        except Exception as e:
+            logging.error(f"Error verifying batch proof: {str(e)}")
+            return False
 
-        # 1. Compute salted hashes for all fields (The Leaves) using provided salts
-        leaf_hashes = []
+    def verify_proof(self, data, proof):
+        """Verify a document proof in either form: a direct signature or a batch Merkle proof"""
+        proof = proof or {}
+        if not proof.get("signatureValue"):
+            return False
+        if proof.get("type") == self.BATCH_PROOF_TYPE:
+            return self.verify_batch_proof(data, proof)
+        return self.verify_signature(data, proof["signatureValue"])
+
+    def hash_field_leaf(self, salt, field, value):
+        """COLLISION-SAFE leaf construction [Security Fix #1]: hash(salt + "|" + field + "|" + value)"""
+        return self.hash_data(f"{salt}|{field}|{value}")
+
+    def build_field_merkle_tree(self, all_fields, field_salts):
+        """
+        Salted leaf hashes and root for a credential's field map.
+        Deterministic for a given field map and stored salts, so callers can persist the result.
+        """
+        leaves = {}
         for field, value in all_fields.items():
             salt = field_salts.get(field)
             if not salt:
                 # Fallback purely for safety, shouldn't happen with stored salts
                 salt = secrets.token_hex(16)
+            leaves[field] = self.hash_field_leaf(salt, field, value)
 
-            # COLLISION-SAFE Construction [Security Fix #1]
-            leaf_content = f"{salt}|{field}|{value}"
-            leaf_hashes.append(self.hash_data(leaf_content))
+        return {"leaves": leaves, "root": self.create_merkle_root(list(leaves.values()))}
 
-        # 2. Create Merkle root of all (blinded) fields
-        merkle_root = self.create_merkle_root(leaf_hashes)
+    def create_proof_for_fields(self, all_fields, selected_fields, field_salts, merkle_tree=None, field_tree=None):
+        """
+        Create a ELITE salted Merkle proof for selective disclosure using PRE-STORED salts.
+        Collision-safe construction: hash(salt + "|" + field + "|" + value)
+
+        merkle_tree / field_tree: precomputed output of build_field_merkle_tree / create_merkle_tree,
+        so a disclosure only assembles inclusion paths and signs.
+        """
+        # 1. Salted hashes for all fields (The Leaves) and the Merkle root of all (blinded) fields
+        if merkle_tree is None:
+            merkle_tree = self.build_field_merkle_tree(all_fields, field_salts)
+        if field_tree is None:
+            field_tree = self.create_merkle_tree(list(merkle_tree["leaves"].values()))
+
+        # 2. Inclusion paths for the disclosed fields only
+        disclosed_paths = {
+            field: self.create_merkle_path(field_tree, merkle_tree["leaves"][field])
+            for field in selected_fields
+            if field in merkle_tree["leaves"]
+        }
 
         # 3. Construct the disclosure proof
         proof = {
             "type": "MerkleStoreDisclosure",
-            "merkle_root": merkle_root,
+            "merkle_root": merkle_tree["root"],
             "disclosed_salts": {field: field_salts[field] for field in selected_fields},
+            "disclosed_paths": disclosed_paths,
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "nonce": secrets.token_hex(8),
         }
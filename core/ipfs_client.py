@@ -20,11 +20,16 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
+import copy
 import hashlib
 import os
+import threading
+from collections import OrderedDict
 
 # FIXED: Import DATA_DIR from core package [web:42]
 from . import DATA_DIR, PROJECT_ROOT  # [web:42]
+from .canonical import CanonicalDocument
+from .course_catalog import CourseCatalog
 
 logging.basicConfig(level=logging.INFO)
 
@@ -32,6 +37,9 @@ logging.basicConfig(level=logging.INFO)
 class IPFSClient:
     """IPFS client for storing credentials off-chain"""
 
+    # Documents kept with their serialized bytes for repeat verifications
+    CANONICAL_CACHE_SIZE = 1024
+
     def __init__(self):
         # Try multiple IPFS endpoints
         self.endpoints = [
@@ -42,6 +50,11 @@ class IPFSClient:
         # FIXED: Use DATA_DIR instead of relative path [web:72]
         self.storage_file = DATA_DIR / "ipfs_storage.json"
         self.local_storage = self.load_local_storage()
+        self._canonical_cache = OrderedDict()
+        self._canonical_lock = threading.Lock()
+        # Catalog refs in stored documents are always expanded on read; compact_documents also writes them
+        self.course_catalog = CourseCatalog(DATA_DIR / "course_catalog.json")
+        self.compact_documents = False
         self.find_working_endpoint()
 
     def find_working_endpoint(self):
@@ -64,7 +77,8 @@ class IPFSClient:
         return self.current_endpoint is not None
 
     def add_json(self, data):
-        """Add JSON data to IPFS"""
+        """Add JSON data (dict or CanonicalDocument) to IPFS"""
+        data = CanonicalDocument.wrap(data)
         if self.current_endpoint:
             return self._add_to_ipfs(data)
         else:
@@ -73,7 +87,7 @@ class IPFSClient:
     def _add_to_ipfs(self, data):
         """Add data to actual IPFS network"""
         try:
-            json_data = json.dumps(data, indent=2)
+            json_data = data.pretty_bytes
             files = {"file": ("credential.json", json_data, "application/json")}
 
             response = requests.post(f"{self.current_endpoint}/api/v0/add", files=files, timeout=30)
@@ -102,14 +116,20 @@ class IPFSClient:
             DATA_DIR.mkdir(parents=True, exist_ok=True)
 
             # Generate a pseudo-CID for local storage
-            data_string = json.dumps(data, sort_keys=True)
-            pseudo_cid = f"local_{hashlib.sha256(data_string.encode()).hexdigest()[:16]}"
+            data_bytes = data.sorted_bytes
+            pseudo_cid = f"local_{hashlib.sha256(data_bytes).hexdigest()[:16]}"
+
+            stored = copy.deepcopy(data.data)  # Later edits to the caller's dict must not reach storage
+            if self.compact_documents:
+                # encode() persists new ids before the document that references them is written
+                stored = self.course_catalog.compact_document(stored)
 
             self.local_storage[pseudo_cid] = {
-                "data": data,
+                "data": stored,
                 "timestamp": datetime.now().isoformat(),
-                "size": len(data_string),
+                "size": len(data_bytes),
             }
+            self._remember_canonical(pseudo_cid, data)
 
             self.save_local_storage()
             logging.info(f"Data stored locally with pseudo-CID: {pseudo_cid}")
@@ -119,6 +139,45 @@ class IPFSClient:
             logging.error(f"Error storing locally: {str(e)}")
             return None
 
+    def _remember_canonical(self, cid, document):
+        """Cache a frozen view: one copy up front, then shared read-only by every reader"""
+        document = document.frozen()
+        with self._canonical_lock:
+            self._canonical_cache[cid] = document
+            self._canonical_cache.move_to_end(cid)
+            while len(self._canonical_cache) > self.CANONICAL_CACHE_SIZE:
+                self._canonical_cache.popitem(last=False)
+
+    def get_canonical(self, cid):
+        """
+        Fetched document as a read-only CanonicalDocument, memoized per CID.
+        IPFS content is addressed by its CID, so serialized bytes can be reused across verifications.
+        Local pseudo-CIDs name entries in a mutable storage file instead, so a cached local document is
+        only served while the stored entry still matches it.
+        """
+        with self._canonical_lock:
+            document = self._canonical_cache.get(cid)
+            if document is not None:
+                self._canonical_cache.move_to_end(cid)
+        if document is not None and (not cid.startswith("local_") or self._matches_local_storage(cid, document)):
+            return document
+
+        data = self.get_json(cid)
+        if data is None:
+            with self._canonical_lock:
+                self._canonical_cache.pop(cid, None)
+            return None
+        document = CanonicalDocument(data).frozen()
+        self._remember_canonical(cid, document)
+        return document
+
+    def _matches_local_storage(self, cid, document):
+        """Whether the locally stored entry still holds exactly the cached document's data"""
+        entry = self.local_storage.get(cid)
+        if entry is None:
+            return False
+        return self.course_catalog.expand_document(entry["data"]) == document.data
+
     def get_json(self, cid):
         """Retrieve JSON data from IPFS or local storage"""
         if cid.startswith("local_"):
@@ -148,7 +207,7 @@ class IPFSClient:
         try:
             if cid in self.local_storage:
                 logging.info(f"Retrieved data from local storage: {cid}")
-                return self.local_storage[cid]["data"]
+                return self.course_catalog.expand_document(self.local_storage[cid]["data"])
             else:
                 logging.error(f"CID not found in local storage: {cid}")
                 return None
@@ -21,6 +21,8 @@ import random
 from datetime import datetime
 import logging
 
+from .merkle import MerkleTree
+
 logging.basicConfig(level=logging.INFO)
 
 
@@ -184,14 +186,15 @@ class ZKPManager:
             sorted_set = sorted(full_set)
             leaves = [hashlib.sha256(item.encode()).hexdigest() for item in sorted_set]
 
-            # Build Merkle root
-            merkle_root = self._build_merkle_root(leaves)
+            # Build Merkle tree once (root + path)
+            tree = MerkleTree.from_hex(leaves)
+            merkle_root = tree.root_hex
 
             # Find index of claimed member
             member_index = sorted_set.index(claimed_member)
 
-            # Generate Merkle proof path
-            merkle_path = self._generate_merkle_path(leaves, member_index)
+            # Generate Merkle proof path: [(sibling hash, sibling_is_left), ...]
+            merkle_path = [(sibling.hex(), is_left) for sibling, is_left in tree.proof(member_index)]
 
             proof = {
                 "type": "MembershipProof",
@@ -230,14 +233,8 @@ class ZKPManager:
             claimed_root = proof["merkleRoot"]
 
             # Reconstruct root from path
-            current_hash = member_hash
-            for sibling_hash, is_left in merkle_path:
-                if is_left:
-                    current_hash = hashlib.sha256((sibling_hash + current_hash).encode()).hexdigest()
-                else:
-                    current_hash = hashlib.sha256((current_hash + sibling_hash).encode()).hexdigest()
-
-            if current_hash != claimed_root:
+            steps = [(bytes.fromhex(sibling_hash), bool(is_left)) for sibling_hash, is_left in merkle_path]
+            if not MerkleTree.verify_proof(bytes.fromhex(member_hash), steps, bytes.fromhex(claimed_root)):
                 return {
                     "valid": False,
                     "error": "Merkle root verification failed",
@@ -349,50 +346,3 @@ class ZKPManager:
 
         except Exception as e:
             return {"valid": False, "error": str(e)}
-
-    # ==================== HELPER METHODS ====================
-    def _build_merkle_root(self, leaves):
-        """Build Merkle root from leaf hashes"""
-        if not leaves:
-            return None
-        if len(leaves) == 1:
-            return leaves[0]
-
-        tree_level = leaves
-        while len(tree_level) > 1:
-            next_level = []
-            for i in range(0, len(tree_level), 2):
-                left = tree_level[i]
-                right = tree_level[i + 1] if i + 1 < len(tree_level) else left
-                parent = hashlib.sha256((left + right).encode()).hexdigest()
-                next_level.append(parent)
-            tree_level = next_level
-
-        return tree_level[0]
-
-    def _generate_merkle_path(self, leaves, index):
-        """Generate Merkle proof path for a leaf"""
-        path = []
-        tree_level = leaves
-        current_index = index
-
-        while len(tree_level) > 1:
-            next_level = []
-            for i in range(0, len(tree_level), 2):
-                left = tree_level[i]
-                right = tree_level[i + 1] if i + 1 < len(tree_level) else left
-
-                # Record sibling in path
-                if i == current_index:
-                    path.append((right, False))  # Sibling is on right
-                    current_index = i // 2
-                elif i + 1 == current_index:
-                    path.append((left, True))  # Sibling is on left
-                    current_index = i // 2
-
-                parent = hashlib.sha256((left + right).encode()).hexdigest()
-                next_level.append(parent)
-
-            tree_level = next_level
-
-        return path
@@ -30,7 +30,9 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from app.app import create_app
-app = create_app()
+# Spawned worker processes (the signing pool) re-import this file as __mp_main__; they must not boot the app
+if __name__ != '__mp_main__':
+    app = create_app()
 from app.config import Config
 
 def initialize_app():
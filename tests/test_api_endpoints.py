@@ -99,3 +99,226 @@ def test_unauthorized_issuer_routes(client):
     # The /issuer route is a portal page — it serves the login form inline (200)
     # rather than issuing a 302 redirect. This is the correct expected behaviour.
     assert response.status_code == 200
+
+def test_batch_verify_api_streams_ndjson(client, auth_client, sample_credential_data):
+    """Bulk verification streams one NDJSON line per credential plus a summary"""
+    issue_resp = auth_client.post(
+        '/api/issue_credential',
+        data=json.dumps(sample_credential_data),
+        content_type='application/json'
+    )
+    cred_id = json.loads(issue_resp.data)['credential_id']
+
+    response = client.post(
+        '/api/verify_credentials/batch',
+        data=json.dumps({'credential_ids': [cred_id, 'unknown-id'], 'privacy_mode': True}),
+        content_type='application/json'
+    )
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+
+    lines = [json.loads(line) for line in response.data.decode().splitlines() if line.strip()]
+    results = {line['credential_id']: line['result'] for line in lines if 'credential_id' in line}
+    assert results[cred_id]['valid'] is True
+    assert 'credential' not in results[cred_id]
+    assert results['unknown-id']['status'] == 'not_found'
+    assert lines[-1]['summary'] == {'total': 2, 'valid': 1, 'invalid': 1}
+
+
+def test_batch_verify_api_accepts_csv(client, auth_client, sample_credential_data):
+    """Bulk verification accepts an uploaded CSV with a credential_id column"""
+    import io
+
+    issue_resp = auth_client.post(
+        '/api/issue_credential',
+        data=json.dumps(sample_credential_data),
+        content_type='application/json'
+    )
+    cred_id = json.loads(issue_resp.data)['credential_id']
+
+    csv_bytes = f"name,credential_id\nJohn,{cred_id}\n".encode()
+    response = client.post(
+        '/api/verify_credentials/batch',
+        data={'file': (io.BytesIO(csv_bytes), 'candidates.csv')},
+        content_type='multipart/form-data'
+    )
+    lines = [json.loads(line) for line in response.data.decode().splitlines() if line.strip()]
+    assert lines[0]['credential_id'] == cred_id
+    assert lines[0]['result']['valid'] is True
+
+def test_async_issue_credential_job_status(auth_client, sample_credential_data):
+    """Async issuance returns a job id whose status endpoint reports the issued credential"""
+    from app.app import issuance_pipeline
+
+    payload = dict(sample_credential_data, student_id='ASYNC001')
+    payload['async'] = True
+    response = auth_client.post('/api/issue_credential', data=json.dumps(payload), content_type='application/json')
+    assert response.status_code == 202
+    job_id = json.loads(response.data)['job_id']
+
+    issuance_pipeline.wait(job_id, timeout=30)
+    status = json.loads(auth_client.get(f'/api/issue_credential/jobs/{job_id}').data)
+    assert status['job']['status'] == 'completed'
+    assert status['job']['result']['student_id'] == 'ASYNC001'
+
+    assert auth_client.get('/api/issue_credential/jobs/unknown').status_code == 404
+
+def test_status_list_tracks_revocation_with_etag(client, auth_client, sample_credential_data):
+    """Revoking a credential flips its bit in the published list and changes the ETag"""
+    from core.status_list import StatusList
+
+    issued = json.loads(auth_client.post(
+        '/api/issue_credential',
+        data=json.dumps(dict(sample_credential_data, student_id='STATUS001')),
+        content_type='application/json'
+    ).data)
+    cred = json.loads(client.get(f"/api/credential/{issued['credential_id']}").data)['credential']
+    index = cred['status_list_index']
+    assert cred['full_credential']['credentialStatus']['statusListIndex'] == str(index)
+
+    first = client.get('/api/status/list')
+    etag = first.headers['ETag'].strip('"')
+    assert StatusList.check(first.get_json()['credentialSubject']['encodedList'], index) is False
+    assert client.get('/api/status/list', headers={'If-None-Match': f'"{etag}"'}).status_code == 304
+
+    auth_client.post('/api/revoke_credential', data=json.dumps({
+        'credential_id': issued['credential_id'], 'reason': 'Status list test'
+    }), content_type='application/json')
+
+    second = client.get('/api/status/list', headers={'If-None-Match': f'"{etag}"'})
+    assert second.status_code == 200
+    assert StatusList.check(second.get_json()['credentialSubject']['encodedList'], index) is True
+
+def test_registry_export_import_api(app, auth_client, sample_credential_data):
+    """Admin export streams NDJSON and the import endpoint accepts it back"""
+    import io
+
+    auth_client.post('/api/issue_credential', data=json.dumps(dict(sample_credential_data, student_id='NDJSON1')),
+                     content_type='application/json')
+
+    response = auth_client.get('/api/admin/registry/export')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    lines = response.data.splitlines()
+    assert any(json.loads(line)['student_id'] == 'NDJSON1' for line in lines)
+
+    imported = auth_client.post('/api/admin/registry/import', data={
+        'file': (io.BytesIO(response.data), 'registry.ndjson')
+    }, content_type='multipart/form-data')
+    result = json.loads(imported.data)
+    assert result['success'] is True
+    assert result['skipped'] == len(lines)
+
+    assert app.test_client().get('/api/admin/registry/export').status_code == 403
+
+def test_batch_revoke_credentials_api(auth_client, sample_credential_data):
+    """Batch revoke returns per-item results"""
+    ids = []
+    for n in range(2):
+        response = auth_client.post('/api/issue_credential', data=json.dumps(dict(sample_credential_data, student_id=f'BREV{n}')),
+                                    content_type='application/json')
+        ids.append(json.loads(response.data)['credential_id'])
+
+    response = auth_client.post('/api/revoke_credentials/batch', data=json.dumps({
+        'credential_ids': ids + ['unknown'], 'reason': 'Grading error', 'reason_category': 'other'
+    }), content_type='application/json')
+    data = json.loads(response.data)
+    assert response.status_code == 200 and data['revoked'] == 2
+    assert {item['credential_id']: item['success'] for item in data['results']} == {ids[0]: True, ids[1]: True, 'unknown': False}
+
+    response = auth_client.post('/api/revoke_credentials/batch', data=json.dumps({'credential_ids': []}),
+                                content_type='application/json')
+    assert response.status_code == 400
+
+def test_batch_issue_credentials_api(client, auth_client, sample_credential_data):
+    import uuid
+
+    prefix = f'BI{uuid.uuid4().hex[:6].upper()}'
+    transcripts = [dict(sample_credential_data, student_id=f'{prefix}{n}') for n in range(3)]
+    transcripts.append(dict(sample_credential_data, cgpa=11))
+    response = auth_client.post('/api/issue_credentials/batch', data=json.dumps({'transcripts': transcripts}),
+                                content_type='application/json')
+    data = json.loads(response.data)
+    assert response.status_code == 200 and data['issued'] == 3 and data['failed'] == 1
+    assert data['results'][3]['error'] == 'CGPA must be between 0.00 and 10.00'
+
+    verify = client.post('/api/verify_credential', data=json.dumps({'credential_id': data['results'][0]['credential_id']}),
+                         content_type='application/json')
+    assert json.loads(verify.data)['valid'] is True
+
+def test_issue_credential_idempotency_key(auth_client, sample_credential_data):
+    """A retried issuance with the same Idempotency-Key returns the original credential"""
+    import uuid
+    from app.app import credential_manager
+
+    student_id = f'IDEM{uuid.uuid4().hex[:8].upper()}'
+    payload = json.dumps(dict(sample_credential_data, student_id=student_id))
+    headers = {'Idempotency-Key': f'issue-{student_id}'}
+
+    first = auth_client.post('/api/issue_credential', data=payload, content_type='application/json', headers=headers)
+    retry = auth_client.post('/api/issue_credential', data=payload, content_type='application/json', headers=headers)
+    assert first.status_code == retry.status_code == 200
+    assert retry.headers.get('Idempotent-Replayed') == 'true'
+    assert json.loads(retry.data)['credential_id'] == json.loads(first.data)['credential_id']
+    assert len(credential_manager.get_credentials_by_student(student_id)) == 1
+
+    reused = auth_client.post('/api/issue_credential', data=json.dumps(dict(sample_credential_data, student_id=f'{student_id}X')),
+                              content_type='application/json', headers=headers)
+    assert reused.status_code == 422
+
+def test_qr_secret_verify_rejects_unknown_credential(client):
+    response = client.post('/api/qr/verify-secret', data=json.dumps({'credential_id': 'bogus-id', 'qk': 'x'}),
+                           content_type='application/json')
+    assert response.status_code == 404
+    assert json.loads(response.data)['status'] == 'fake'
+
+def test_credential_qr_reuses_token_until_registry_changes(client, auth_client, sample_credential_data, monkeypatch):
+    """Repeated QR renders reuse the signed token; a revocation forces a fresh one"""
+    import uuid
+    from urllib.parse import urlsplit, parse_qs
+    from app.app import crypto_manager
+
+    signed = []
+    sign_jws = crypto_manager.sign_jws
+    monkeypatch.setattr(crypto_manager, 'sign_jws', lambda payload: signed.append(payload) or sign_jws(payload))
+
+    issued = json.loads(auth_client.post('/api/issue_credential', data=json.dumps(
+        dict(sample_credential_data, student_id=f'QR{uuid.uuid4().hex[:8].upper()}')), content_type='application/json').data)
+    credential_id = issued['credential_id']
+
+    def qr_query():
+        verify_url = json.loads(client.get(f'/api/credential/{credential_id}/qr').data)['verify_url']
+        return parse_qs(urlsplit(verify_url).query)
+
+    first, second = qr_query(), qr_query()
+    assert first['qk'] == second['qk'] and first['gt'] == second['gt']
+    assert [payload['cid'] for payload in signed] == [credential_id]
+
+    auth_client.post('/api/revoke_credential', data=json.dumps({
+        'credential_id': credential_id, 'reason': 'QR cache test'
+    }), content_type='application/json')
+    qr_query()
+    assert [payload['cid'] for payload in signed] == [credential_id, credential_id]
+
+def test_registry_analytics_api(app, auth_client):
+    response = auth_client.get('/api/admin/analytics?by=batch&status=active&bins=5')
+    data = json.loads(response.data)
+    assert response.status_code == 200 and data['by'] == 'batch' and data['bins'] == 5
+    assert set(data['status_counts']) >= {'total', 'active', 'revoked', 'superseded'}
+
+    assert auth_client.get('/api/admin/analytics?by=name').status_code == 400
+    assert app.test_client().get('/api/admin/analytics').status_code == 403
+
+def test_public_issuers_lists_every_key(client):
+    response = client.get('/api/public/issuers')
+    issuer = json.loads(response.data)['issuers']['did:edu:gprec']
+    assert response.status_code == 200 and issuer['algorithm'] == 'PS256'
+    assert {key['algorithm'] for key in issuer['keys']} == {'PS256', 'EdDSA', 'ES256'}
+    assert issuer['activeKid'] in {key['kid'] for key in issuer['keys']}
+
+def test_readiness_probe(client):
+    from app.app import crypto_manager
+
+    crypto_manager.wait_ready(60)
+    response = client.get('/api/ready')
+    assert response.status_code == 200 and json.loads(response.data)['ready'] is True
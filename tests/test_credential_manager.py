@@ -88,3 +88,226 @@ def test_versioning_and_supersedence(credential_manager, sample_credential_data)
     v2_verify = credential_manager.verify_credential(v2_id)
     assert v2_verify['status'] == 'active'
     assert v2_verify['valid'] is True
+
+def test_verify_credentials_batch(credential_manager, sample_credential_data):
+    """Batch verification returns one result per distinct ID, including unknown and revoked ones"""
+    active_id = credential_manager.issue_credential(sample_credential_data)['credential_id']
+
+    other_data = sample_credential_data.copy()
+    other_data['student_id'] = 'TEST456'
+    revoked_id = credential_manager.issue_credential(other_data)['credential_id']
+    credential_manager.revoke_credential(revoked_id, "Batch test")
+
+    results = dict(credential_manager.verify_credentials_batch(
+        [active_id, f"urn:uuid:{active_id}", revoked_id, "does-not-exist"]
+    ))
+
+    assert len(results) == 3
+    assert results[active_id]['valid'] is True
+    assert results[active_id]['verification_details']['blockchain_verified'] is True
+    assert results[revoked_id]['status'] == 'revoked'
+    assert results['does-not-exist']['status'] == 'not_found'
+
+def test_list_credentials_paginated_and_projected(credential_manager, sample_credential_data):
+    """Listing reads registry metadata only, paginates and never mutates shared entries"""
+    for student_id in ('TEST001', 'TEST002', 'TEST003'):
+        data = sample_credential_data.copy()
+        data['student_id'] = student_id
+        credential_manager.issue_credential(data)
+
+    page = credential_manager.list_credentials(page=2, per_page=2, fields=['student_id', 'status'])
+    assert page['total'] == 3
+    assert page['pages'] == 2
+    assert len(page['credentials']) == 1
+    assert set(page['credentials'][0]) == {'credential_id', 'student_id', 'status'}
+
+    with_docs = credential_manager.list_credentials(page=1, per_page=3, include_documents=True)
+    assert all(c['full_credential']['studentId'] == c['student_id'] for c in with_docs['credentials'])
+    assert all('full_credential' not in e for e in credential_manager.credentials_registry.values())
+
+    assert credential_manager.count_credentials_by_status() == {
+        'total': 3, 'active': 3, 'revoked': 0, 'superseded': 0
+    }
+
+def test_credential_history_search_is_indexed(credential_manager, sample_credential_data):
+    """History search tracks issue/revoke and supports ranked pagination"""
+    first_id = credential_manager.issue_credential(sample_credential_data)['credential_id']
+    second_id = credential_manager.issue_credential(sample_credential_data)['credential_id']
+
+    history = credential_manager.get_credential_history('test12')
+    assert [c['credential_id'] for c in history['credentials']] == [first_id, second_id]
+
+    superseded = credential_manager.get_credential_history('superseded')
+    assert [c['credential_id'] for c in superseded['credentials']] == [first_id]
+
+    credential_manager.revoke_credential(second_id, 'Index test')
+    assert credential_manager.get_credential_history('revoked')['total_versions'] == 1
+
+    page = credential_manager.get_credential_history('TEST123', page=1, per_page=1)
+    assert page['pages'] == 2
+    assert page['credentials'][0]['credential_id'] == second_id  # newest version first on equal score
+
+def test_registry_snapshots_are_copy_on_write(app, credential_manager, sample_credential_data):
+    """Readers keep a consistent snapshot while writers issue/revoke concurrently"""
+    import threading
+
+    first_id = credential_manager.issue_credential(sample_credential_data)['credential_id']
+    snapshot = credential_manager.credentials_registry
+    credential_manager.revoke_credential(first_id, 'Snapshot test')
+    assert snapshot[first_id]['status'] == 'active'
+    assert credential_manager.credentials_registry[first_id]['status'] == 'revoked'
+
+    errors = []
+    done = threading.Event()
+
+    def reader():
+        try:
+            while not done.is_set():
+                credential_manager.list_credentials(page=None, fields=['status'])
+                credential_manager.count_credentials_by_status()
+                credential_manager.verify_credential(first_id)
+        except Exception as e:
+            errors.append(e)
+
+    def writer(n):
+        with app.app_context():
+            data = dict(sample_credential_data, student_id=f'COW{n}')
+            credential_manager.issue_credential(data)
+
+    readers = [threading.Thread(target=reader) for _ in range(3)]
+    for t in readers:
+        t.start()
+    writers = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in writers:
+        t.start()
+    for t in writers:
+        t.join()
+    done.set()
+    for t in readers:
+        t.join()
+
+    assert errors == []
+    assert credential_manager.count_credentials_by_status()['total'] == 5
+
+def test_registry_ndjson_export_import_roundtrip(blockchain, crypto_manager, ipfs_client, credential_manager, sample_credential_data):
+    """Gzip NDJSON export re-imports into another node in batches; existing rows are skipped"""
+    import io
+    import gzip
+    import json
+
+    for n in range(3):
+        credential_manager.issue_credential(dict(sample_credential_data, student_id=f'EXP{n}'))
+
+    exported = b''.join(credential_manager.export_registry(compress=True))
+    rows = [json.loads(line) for line in gzip.decompress(exported).splitlines()]
+    assert {row['credential_id'] for row in rows} == set(credential_manager.credentials_registry)
+
+    from core.credential_manager import CredentialManager
+
+    other = CredentialManager(blockchain, crypto_manager, ipfs_client)
+    other.reset_registry()
+    result = other.import_registry(io.BytesIO(exported), batch_size=2)
+    assert result['success'] and result['imported'] == 3 and result['error_count'] == 0
+    assert other.credentials_registry == credential_manager.credentials_registry
+
+    again = other.import_registry(['{"credential_id": "x"}', json.dumps(rows[0])])
+    assert again['imported'] == 0 and again['skipped'] == 1 and again['error_count'] == 1
+
+def test_import_rejects_status_index_collisions(credential_manager, sample_credential_data):
+    """An imported row may not share a status bit with another credential; overwrite frees the old bit"""
+    import json
+
+    local_id = credential_manager.issue_credential(dict(sample_credential_data, student_id='IDX1'))['credential_id']
+    local_index = credential_manager.credentials_registry[local_id]['status_list_index']
+    credential_manager.revoke_credential(local_id, 'Index test')
+    row = {'credential_id': 'imported-1', 'ipfs_cid': 'local_x', 'credential_hash': 'h', 'status': 'active'}
+
+    result = credential_manager.import_registry([json.dumps(dict(row, status_list_index=local_index))])
+    assert result['imported'] == 0 and 'already used by' in result['errors'][0]
+    assert credential_manager.status_list.is_set(local_index) is True
+
+    moved = dict(credential_manager.credentials_registry[local_id], status_list_index=local_index + 50)
+    assert credential_manager.import_registry([json.dumps(moved)], overwrite=True)['imported'] == 1
+    assert credential_manager.status_list.is_set(local_index + 50) is True
+    assert credential_manager.status_list.owner(local_index) is None
+    assert credential_manager.status_list.is_set(local_index) is False
+
+def test_version_chain_tracks_versions_and_lineage(credential_manager, sample_credential_data):
+    """Latest version, per-student history and lineage come from the version index"""
+    first_id = credential_manager.issue_credential(sample_credential_data)['credential_id']
+    second_id = credential_manager.create_new_version(first_id, sample_credential_data, 'Fix')['credential_id']
+    third_id = credential_manager.create_new_version(second_id, sample_credential_data, 'Fix again')['credential_id']
+
+    student_id = sample_credential_data['student_id']
+    assert credential_manager._get_latest_active_credential(student_id) == third_id
+    assert credential_manager._calculate_version_for_student(student_id) == 4
+    assert [c['credential_id'] for c in credential_manager.get_credentials_by_student(student_id)] == [third_id, second_id, first_id]
+    assert [c['version'] for c in credential_manager.get_credential_lineage(f'urn:uuid:{third_id}')] == [3, 2, 1]
+
+    credential_manager.revoke_credential(third_id, 'Lineage test')
+    assert credential_manager._get_latest_active_credential(student_id) is None
+
+    credential_manager.reset_registry()
+    assert credential_manager.get_credentials_by_student(student_id) == []
+
+def test_batch_revocation_uses_one_block(blockchain, credential_manager, sample_credential_data):
+    """Valid targets are revoked together in a single block; invalid ones are reported per item"""
+    from core.registry_replay import RegistryReplay
+
+    ids = [credential_manager.issue_credential(dict(sample_credential_data, student_id=f'BATCH{n}'))['credential_id']
+           for n in range(3)]
+    credential_manager.revoke_credential(ids[2], 'Already gone')
+    chain_length = len(blockchain.chain)
+
+    result = credential_manager.revoke_credentials_batch(ids + ['missing-id', ids[0]], 'Grading error')
+    assert result['success'] and result['revoked'] == 2 and result['failed'] == 2
+    assert [item['success'] for item in result['results']] == [True, True, False, False]
+    assert result['results'][2]['error'] == 'Credential is already revoked'
+    assert len(blockchain.chain) == chain_length + 1
+    assert blockchain.chain[-1].data['credential_ids'] == ids[:2]
+    assert all(credential_manager.credentials_registry[cid]['status'] == 'revoked' for cid in ids)
+
+    assert RegistryReplay(credential_manager).run(verify_documents=False)['consistent']
+    assert credential_manager.revoke_credentials_batch(ids[:1])['success'] is False
+
+def test_unknown_ids_rejected_by_existence_filter(credential_manager, sample_credential_data):
+    """Never-issued IDs are rejected by the Bloom filter; issued ones still verify"""
+    credential_id = credential_manager.issue_credential(sample_credential_data)['credential_id']
+    assert credential_manager.credential_exists(f'urn:uuid:{credential_id}')
+    assert credential_manager.verify_credential(credential_id)['valid']
+
+    rejections = credential_manager.existence_filter.stats['bloom_rejections']
+    result = credential_manager.verify_credential('00000000-0000-0000-0000-000000000000')
+    assert result['status'] == 'not_found'
+    assert credential_manager.existence_filter.stats['bloom_rejections'] == rejections + 1
+    assert not credential_manager.credential_exists('not-a-credential')
+
+def test_batch_issuance_signs_once(credential_manager, sample_credential_data):
+    """A batch shares one root signature and one block; each credential verifies through its own Merkle path"""
+    from core.registry_replay import RegistryReplay
+
+    transcripts = [dict(sample_credential_data, student_id=f'MERKLE{n}') for n in range(5)]
+    chain_length = len(credential_manager.blockchain.chain)
+    sign_calls = []
+    sign_data = credential_manager.crypto_manager.sign_data
+    credential_manager.crypto_manager.sign_data = lambda data: sign_calls.append(data) or sign_data(data)
+    try:
+        result = credential_manager.issue_credentials_batch(transcripts + [transcripts[0]])
+    finally:
+        credential_manager.crypto_manager.sign_data = sign_data
+    assert result['success'] and result['issued'] == 5 and result['failed'] == 1
+    assert 'Duplicate student' in result['results'][5]['error']
+    # One root signature for the credentials plus one for the batch block that anchors them all
+    assert len(sign_calls) == 2 and str(sign_calls[0]).startswith('credential-batch:')
+    assert len(credential_manager.blockchain.chain) == chain_length + 1
+
+    ids = [item['credential_id'] for item in result['results'][:5]]
+    block = credential_manager.blockchain.chain[-1]
+    assert block.data['type'] == 'credential_issuance_batch' and block.data['credential_ids'] == ids
+    assert {item['block_hash'] for item in result['results'][:5]} == {block.hash}
+    proofs = [credential_manager.ipfs_client.get_json(credential_manager.credentials_registry[cid]['ipfs_cid'])['proof']
+              for cid in ids]
+    assert {proof['type'] for proof in proofs} == {'MerkleProof2019'}
+    assert len({proof['signatureValue'] for proof in proofs}) == 1
+    assert all(credential_manager.verify_credential(cid)['valid'] for cid in ids)
+    assert RegistryReplay(credential_manager).run()['consistent']
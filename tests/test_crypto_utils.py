@@ -66,3 +66,166 @@ def test_invalid_jws_tampering(crypto_manager):
     success, result = crypto_manager.verify_jws(tampered_token)
     assert success is False
     assert result is None
+
+def test_merkle_paths_match_root(crypto_manager):
+    """Inclusion paths from the level cache must recompute create_merkle_root (odd leaf counts included)"""
+    leaves = [crypto_manager.hash_data(f"leaf-{i}") for i in range(7)]
+    levels = crypto_manager.create_merkle_levels(leaves)
+    root = crypto_manager.create_merkle_root(leaves)
+    assert levels[-1][0] == root
+
+    for leaf in leaves:
+        path = crypto_manager.create_merkle_path(levels, leaf)
+        assert crypto_manager.verify_merkle_path(leaf, path, root) is True
+
+    assert crypto_manager.verify_merkle_path(crypto_manager.hash_data("forged"), path, root) is False
+
+@pytest.mark.parametrize("algorithm", ["EdDSA", "ES256"])
+def test_kid_tagged_signatures_and_legacy_rsa(crypto_manager, algorithm):
+    """New keys tag signatures with their kid; untagged RSA signatures stay verifiable"""
+    data = {"id": "123", "score": 85}
+    crypto_manager.set_signing_algorithm("PS256")
+    legacy_signature = crypto_manager.sign_data(data)
+    legacy_token = crypto_manager.sign_jws(data)
+    assert ":" not in legacy_signature
+
+    kid = crypto_manager.set_signing_algorithm(algorithm)
+    signature = crypto_manager.sign_data(data)
+    assert signature.startswith(f"{kid}:")
+    assert crypto_manager.signature_key_id(signature) == kid
+    assert crypto_manager.verify_signature(data, signature) is True
+    assert crypto_manager.verify_signature(data, legacy_signature) is True
+    assert crypto_manager.verify_signature({"id": "124", "score": 85}, signature) is False
+
+    token = crypto_manager.sign_jws(data)
+    assert crypto_manager.verify_jws(token) == (True, data)
+    assert crypto_manager.verify_jws(legacy_token) == (True, data)
+
+    # A signature cannot be replayed under another key's kid
+    other_kid = next(entry["kid"] for entry in crypto_manager.get_public_keys() if entry["kid"] != kid)
+    assert crypto_manager.verify_signature(data, f"{other_kid}:{signature.split(':', 1)[1]}") is False
+
+def test_public_keys_list_every_algorithm(crypto_manager):
+    keys = {entry["algorithm"]: entry for entry in crypto_manager.get_public_keys()}
+    assert set(keys) == {"PS256", "EdDSA", "ES256"}
+    assert keys["PS256"]["legacy"] is True
+    assert sum(entry["active"] for entry in keys.values()) == 1
+    with pytest.raises(ValueError):
+        crypto_manager.set_signing_algorithm("HS256")
+
+def test_batch_proofs_verify_per_document(crypto_manager):
+    """One root signature covers the batch; paths do not transfer between documents"""
+    documents = [{"id": i, "score": 80 + i} for i in range(7)]
+    proofs = crypto_manager.sign_batch(documents)
+    assert len({proof["signatureValue"] for proof in proofs}) == 1
+
+    for document, proof in zip(documents, proofs):
+        assert crypto_manager.verify_proof(document, dict(proof, type="MerkleProof2019")) is True
+    assert crypto_manager.verify_batch_proof(documents[1], proofs[0]) is False
+    assert crypto_manager.verify_batch_proof({"id": 0, "score": 99}, proofs[0]) is False
+    # The root signature is domain-separated from a plain signature over the root
+    forged = dict(proofs[0], signatureValue=crypto_manager.sign_data(proofs[0]["merkleRoot"]))
+    assert crypto_manager.verify_batch_proof(documents[0], forged) is False
+
+def test_lazy_single_flight_provisioning(tmp_path):
+    """Construction is instant; concurrent first uses generate the keys once and later managers load them"""
+    import threading
+    from core.crypto_utils import CryptoManager
+
+    def manager():
+        cm = CryptoManager(signing_algorithm="ES256")
+        cm.key_file, cm.keyring_file, cm.lock_file = (
+            tmp_path / "keys.pem", tmp_path / "ring.json", tmp_path / "keys.lock"
+        )
+        return cm
+
+    cm = manager()
+    assert cm.is_ready is False and not cm.key_file.exists()
+
+    generated = []
+    generate_keys = cm.generate_keys
+    cm.generate_keys = lambda: generated.append(1) or generate_keys()
+    signatures = []
+    threads = [threading.Thread(target=lambda: signatures.append(cm.sign_data("payload"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert generated == [1] and cm.wait_ready(0) is True
+    assert all(cm.verify_signature("payload", signature) for signature in signatures)
+    assert cm.active_kid.startswith("p256-")
+
+    other = manager()
+    other.provision_async()
+    assert other.wait_ready(30) is True
+    assert other.legacy_kid == cm.legacy_kid and other.verify_signature("payload", signatures[0])
+
+def test_unreadable_keyring_is_never_replaced(tmp_path):
+    """A damaged keyring fails provisioning instead of being regenerated over"""
+    from core.crypto_utils import CryptoManager
+
+    def manager():
+        cm = CryptoManager()
+        cm.key_file, cm.keyring_file, cm.lock_file = (
+            tmp_path / "keys.pem", tmp_path / "ring.json", tmp_path / "keys.lock"
+        )
+        return cm
+
+    manager().ensure_ready()
+    damaged = manager().keyring_file.read_text()[:200]
+    manager().keyring_file.write_text(damaged)
+
+    cm = manager()
+    with pytest.raises(RuntimeError):
+        cm.ensure_ready()
+    assert cm.sign_data("payload") is None and cm.is_ready is False
+    assert cm.keyring_file.read_text() == damaged
+
+def test_create_app_does_not_wait_for_key_generation(tmp_path, monkeypatch):
+    """create_app() returns while keys are still being generated; the configured algorithm applies once they exist"""
+    import threading
+    import app.app as app_module
+    import app.blueprints.admin.routes  # noqa: F401
+    import app.blueprints.api.routes  # noqa: F401
+    import app.blueprints.auth.routes  # noqa: F401
+    import app.blueprints.holder.routes  # noqa: F401
+    import app.blueprints.issuer.routes  # noqa: F401
+    import app.blueprints.verifier.routes  # noqa: F401
+    from core.crypto_utils import CryptoManager
+
+    # Blueprints bind app.app's singletons when first imported; import them now so they keep the real ones
+    cm = CryptoManager()
+    cm.key_file, cm.keyring_file, cm.lock_file = (tmp_path / name for name in ("keys.pem", "ring.json", "keys.lock"))
+    release = threading.Event()
+    load_or_generate_keys = cm.load_or_generate_keys
+    cm.load_or_generate_keys = lambda: release.wait(30) and load_or_generate_keys()
+    monkeypatch.setattr(app_module, "crypto_manager", cm)
+    monkeypatch.setattr(app_module.Config, "SIGNING_ALGORITHM", "ES256")
+
+    app_module.create_app()
+    assert cm.is_ready is False and cm.signing_algorithm == "ES256"
+
+    release.set()
+    assert cm.wait_ready(60) is True
+    assert cm.active_kid.startswith("p256-")
+
+def test_verification_memo_caches_only_valid_signatures(crypto_manager):
+    """Repeat verifications are memo hits; failures are recomputed; the LRU evicts past its bound"""
+    crypto_manager.clear_verify_cache()
+    crypto_manager.verify_cache_size = 2
+    before = crypto_manager.verify_cache_info()
+
+    signatures = {data: crypto_manager.sign_data(data) for data in ("a", "b", "c")}
+    assert crypto_manager.verify_signature("a", signatures["a"]) is True
+    assert crypto_manager.verify_signature("a", signatures["a"]) is True
+    assert crypto_manager.verify_signature("x", signatures["a"]) is False
+    assert crypto_manager.verify_signature("x", signatures["a"]) is False
+
+    info = crypto_manager.verify_cache_info()
+    assert info["hits"] - before["hits"] == 1 and info["misses"] - before["misses"] == 3 and info["size"] == 1
+
+    token = crypto_manager.sign_jws({"sub": "memo"})
+    assert crypto_manager.verify_jws(token) == crypto_manager.verify_jws(token) == (True, {"sub": "memo"})
+    crypto_manager.verify_signature("b", signatures["b"])
+    info = crypto_manager.verify_cache_info()
+    assert info["hits"] - before["hits"] == 2 and info["evictions"] - before["evictions"] == 1 and info["size"] == 2
@@ -0,0 +1,47 @@
+"""
+Tests for the expiring, SQL-backed disclosure store
+"""
+from datetime import datetime, timedelta
+from core.disclosure_store import DisclosureStore
+
+
+def _meta(expires_in_hours):
+    return {
+        'original_id': 'cred-123',
+        'verifier': 'example.com',
+        'expires_at': (datetime.utcnow() + timedelta(hours=expires_in_hours)).isoformat() + 'Z',
+        'created_at': datetime.utcnow().isoformat(),
+    }
+
+
+def test_heap_eviction_after_retention():
+    """Entries survive expiry for the retention window, then get evicted in expiry order"""
+    store = DisclosureStore(retention=timedelta(hours=1))
+    store.put('fresh', _meta(24))
+    store.put('recently-expired', _meta(-0.5))
+    store.put('long-expired', _meta(-2))
+
+    # 'long-expired' was evicted by the put calls; 'recently-expired' is still inside retention
+    assert 'long-expired' not in store
+    assert store['recently-expired']['original_id'] == 'cred-123'
+
+    assert store.evict_expired(now=datetime.utcnow() + timedelta(hours=2)) == 1
+    assert len(store) == 1
+    assert 'fresh' in store
+
+
+def test_sql_backed_store_is_shared_across_instances(app):
+    """A disclosure created by one worker's store resolves from another (or after restart)"""
+    from app.models import db, DisclosureRecord
+
+    with app.app_context():
+        writer = DisclosureStore(db=db, model=DisclosureRecord)
+        reader = DisclosureStore(db=db, model=DisclosureRecord)
+
+        writer.put('shared-disclosure', _meta(24))
+        meta = reader.get('shared-disclosure')
+
+        assert meta is not None
+        assert meta['original_id'] == 'cred-123'
+        assert meta['verifier'] == 'example.com'
+        assert reader.get('missing-disclosure') is None
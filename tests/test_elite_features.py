@@ -239,3 +239,23 @@ def test_domain_normalization_function(credential_manager):
     assert credential_manager.normalize_domain('HTTPS://CAREERS.GOOGLE.COM/') == 'careers.google.com'
     assert credential_manager.normalize_domain(None) == 'generic'
     assert credential_manager.normalize_domain('') == 'generic'
+
+
+# --------------------------------------------------------------------------- #
+# CACHED SALTED MERKLE TREE
+# --------------------------------------------------------------------------- #
+def test_disclosure_uses_precomputed_tree_with_inclusion_paths(credential_manager, crypto_manager, sample_credential_data):
+    """The field tree is built at issuance and disclosures carry verifiable inclusion paths"""
+    result = credential_manager.issue_credential(sample_credential_data)
+    cred_id = result['credential_id']
+    stored_tree = credential_manager.credentials_registry[cred_id]['merkle_tree']
+
+    sd = credential_manager.selective_disclosure(cred_id, ['name', 'gpa'], verifier_domain='test.com')
+    disc = sd['disclosure']
+    proof = disc['proof']
+
+    assert proof['merkle_root'] == stored_tree['root']
+    for field, value in disc['disclosedFields'].items():
+        leaf = crypto_manager.hash_field_leaf(proof['disclosed_salts'][field], field, value)
+        assert leaf == stored_tree['leaves'][field]
+        assert crypto_manager.verify_merkle_path(leaf, proof['disclosed_paths'][field], proof['merkle_root'])
@@ -18,6 +18,7 @@
 """
 Tests for IPFS client functionality — Content Addressing and Fallback
 """
+import copy
 import pytest
 from core.ipfs_client import IPFSClient
 
@@ -80,3 +81,38 @@ def test_local_storage_fallback(ipfs_client):
     retrieved = new_client.get_data(cid)
     
     assert retrieved == data
+
+def test_canonical_documents_are_shared_read_only(ipfs_client):
+    """Cached documents are detached from the caller's dict and cannot be changed by readers"""
+    data = {"credentialSubject": {"name": "A", "courses": ["DBMS"]}}
+    cid = ipfs_client.add_json(data)
+    data["credentialSubject"]["name"] = "changed after storing"
+
+    first = ipfs_client.get_canonical(cid)
+    with pytest.raises(TypeError):
+        first.data["credentialSubject"]["courses"].append("Injected")
+    with pytest.raises(TypeError):
+        first.without("proof").data["extra"] = True
+
+    second = ipfs_client.get_canonical(cid)
+    assert second is first
+    assert second.data == {"credentialSubject": {"name": "A", "courses": ["DBMS"]}}
+
+    editable = copy.deepcopy(second.data)
+    editable["credentialSubject"]["courses"].append("Algorithms")
+    assert type(editable["credentialSubject"]["courses"]) is list
+
+
+def test_cached_local_documents_follow_storage_edits(credential_manager, sample_credential_data):
+    """A local pseudo-CID is not a content address: editing the stored entry must not be masked by the cache"""
+    cred_id = credential_manager.issue_credential(sample_credential_data)['credential_id']
+    cid = credential_manager.credentials_registry[cred_id]['ipfs_cid']
+    ipfs_client = credential_manager.ipfs_client
+    assert ipfs_client.get_canonical(cid).data['credentialSubject']['cgpa'] == 8.5
+
+    ipfs_client.local_storage[cid]['data']['credentialSubject']['cgpa'] = 10.0
+
+    assert ipfs_client.get_canonical(cid).data['credentialSubject']['cgpa'] == 10.0
+    result = credential_manager.verify_credential(cred_id)
+    assert result['valid'] is False
+    assert result['status'] == 'tampered'
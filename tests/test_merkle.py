@@ -0,0 +1,54 @@
+"""
+Tests for the bytes-native Merkle tree
+"""
+import hashlib
+
+import pytest
+from core.merkle import BINARY, MerkleTree
+
+
+def _legacy_root(hex_leaves):
+    """The original hex-string construction (blocks, disclosures and ZKP membership proofs)"""
+    hashes = list(hex_leaves)
+    while len(hashes) > 1:
+        if len(hashes) % 2:
+            hashes.append(hashes[-1])
+        hashes = [hashlib.sha256((hashes[i] + hashes[i + 1]).encode()).hexdigest() for i in range(0, len(hashes), 2)]
+    return hashes[0]
+
+
+def _leaves(count):
+    return [hashlib.sha256(f"leaf-{i}".encode()).hexdigest() for i in range(count)]
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13, 33])
+def test_hex_mode_reproduces_legacy_roots_and_paths(count):
+    tree = MerkleTree.from_hex(_leaves(count))
+    assert tree.root_hex == _legacy_root(_leaves(count))
+    assert tree.levels_hex()[0] == _leaves(count) and len(tree.levels_hex()[-1]) == 1
+
+    for index, leaf in enumerate(tree.level(0)):
+        path = tree.proof(index)
+        assert len(path) == tree.depth - 1
+        assert MerkleTree.verify_proof(leaf, path, tree.root)
+    assert not MerkleTree.verify_proof(hashlib.sha256(b"forged").digest(), tree.proof(0), tree.root)
+
+
+def test_multiproofs_and_binary_mode():
+    leaves = [hashlib.sha256(str(i).encode()).digest() for i in range(11)]
+    for mode in ("hex", BINARY):
+        tree = MerkleTree(leaves, mode)
+        for indices in ([0], [3, 4], [0, 5, 10], list(range(11))):
+            proof = tree.multiproof(indices)
+            # Shared siblings are included once, so a multiproof never exceeds separate proofs
+            assert len(proof["hashes"]) <= sum(len(tree.proof(i)) for i in indices)
+            proven = {i: leaves[i] for i in indices}
+            assert MerkleTree.verify_multiproof(proven, 11, proof["hashes"], tree.root, mode)
+            tampered = dict(proven)
+            tampered[indices[0]] = hashlib.sha256(b"forged").digest()
+            assert not MerkleTree.verify_multiproof(tampered, 11, proof["hashes"], tree.root, mode)
+        assert len(tree.multiproof(range(11))["hashes"]) == 0
+
+    assert MerkleTree(leaves, BINARY).root != MerkleTree(leaves).root
+    with pytest.raises(ValueError):
+        MerkleTree([b"short"])
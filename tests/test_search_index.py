@@ -0,0 +1,49 @@
+"""
+Tests for the n-gram credential search index
+"""
+import pytest
+from core.search_index import CredentialSearchIndex
+
+
+@pytest.fixture
+def search_index():
+    index = CredentialSearchIndex()
+    index.rebuild({
+        'cred-aaa': {'student_id': '229X1A0501', 'student_name': 'Ravi Kumar', 'degree': 'B.Tech',
+                     'department': 'CSE', 'section': 'A', 'status': 'active', 'version': 1},
+        'cred-bbb': {'student_id': '229X1A0502', 'student_name': 'Kumari Devi', 'degree': 'B.Tech',
+                     'department': 'ECE', 'section': 'B', 'status': 'revoked', 'version': 2},
+        'cred-ccc': {'student_id': 'CSE100', 'student_name': 'Anil', 'degree': 'M.Tech',
+                     'department': 'Mechanical', 'section': None, 'status': 'active', 'version': 1},
+    })
+    return index
+
+
+def test_short_and_long_substring_queries(search_index):
+    """Queries up to 3 chars hit one posting list; longer ones intersect trigrams"""
+    assert {cid for cid, _ in search_index.search('ECE')} == {'cred-bbb'}
+    assert {cid for cid, _ in search_index.search('kumar')} == {'cred-aaa', 'cred-bbb'}
+    assert {cid for cid, _ in search_index.search('1A05')} == {'cred-aaa', 'cred-bbb'}
+    assert search_index.search('zzzz') == []
+
+
+def test_ranking_prefers_exact_and_prefix_matches(search_index):
+    """Exact field matches outrank prefix matches, which outrank plain substrings"""
+    ranked = [cid for cid, _ in search_index.search('CSE')]
+    assert ranked[0] == 'cred-ccc'  # prefix of student_id beats exact department
+
+    ranked = [cid for cid, _ in search_index.search('kumar')]
+    assert ranked == ['cred-bbb', 'cred-aaa']  # prefix of name beats substring
+
+    assert [cid for cid, _ in search_index.search('kumar', prefix_only=True)] == ['cred-bbb']
+
+
+def test_incremental_updates(search_index):
+    """Re-indexing an entry after a status change replaces its old postings"""
+    search_index.add('cred-aaa', {'student_id': '229X1A0501', 'student_name': 'Ravi Kumar', 'status': 'revoked'})
+    assert {cid for cid, _ in search_index.search('revoked')} == {'cred-aaa', 'cred-bbb'}
+    assert 'cred-aaa' not in {cid for cid, _ in search_index.search('active')}
+
+    search_index.remove('cred-bbb')
+    assert {cid for cid, _ in search_index.search('revoked')} == {'cred-aaa'}
+    assert len(search_index) == 2
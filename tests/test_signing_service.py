@@ -0,0 +1,84 @@
+"""
+Tests for the process-pool signing service
+"""
+from concurrent.futures import wait
+
+from core.signing_service import SigningService
+
+
+def test_pool_signs_batched_requests(crypto_manager):
+    """Concurrent requests are grouped into pool tasks; signatures verify like inline ones"""
+    crypto_manager.set_signing_algorithm("PS256")
+    service = SigningService(crypto_manager, workers=2, batch_window=0.05)
+    crypto_manager.signer = service
+    try:
+        documents = [{"id": i, "score": 70 + i} for i in range(8)]
+        futures = [crypto_manager.sign_data_async(document) for document in documents]
+        wait(futures, timeout=60)
+        assert all(crypto_manager.verify_signature(d, f.result()) for d, f in zip(documents, futures))
+        assert service.stats["batches"] < len(documents) and service.stats["inline"] == 0
+
+        success, payload = crypto_manager.verify_jws(crypto_manager.sign_jws({"sub": "pool"}))
+        assert success and payload == {"sub": "pool"}
+    finally:
+        crypto_manager.signer = None
+        service.shutdown()
+
+
+def test_inline_for_fast_keys(crypto_manager):
+    """Auto sizing keeps Ed25519 signing in-process (a process hop costs more than the signature)"""
+    crypto_manager.set_signing_algorithm("EdDSA")
+    service = SigningService(crypto_manager, workers=-1)
+    crypto_manager.signer = service
+    try:
+        assert service.pool_size == 0
+        signature = crypto_manager.sign_data_async("payload").result(timeout=5)
+        assert crypto_manager.verify_signature("payload", signature)
+        assert service.stats["inline"] == 1 and service._pool is None
+    finally:
+        crypto_manager.signer = None
+
+
+def test_spawned_workers_do_not_boot_the_app():
+    """Spawn re-runs the entry script as __mp_main__ in every worker; main.py must skip create_app() there"""
+    import runpy
+    from pathlib import Path
+
+    namespace = runpy.run_path(str(Path(__file__).resolve().parent.parent / "main.py"), run_name="__mp_main__")
+    assert "create_app" in namespace and "app" not in namespace
+
+
+def test_pool_recovers_from_a_killed_worker(crypto_manager):
+    """A worker lost to e.g. the OOM killer breaks the pool; it is replaced and signing carries on"""
+    import os
+    import signal
+
+    crypto_manager.set_signing_algorithm("PS256")
+    service = SigningService(crypto_manager, workers=1)
+    crypto_manager.signer = service
+    try:
+        assert crypto_manager.verify_signature("before", crypto_manager.sign_data("before"))
+        broken_pool = service._pool
+        for pid in list(broken_pool._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        signature = crypto_manager.sign_data("after")
+        assert signature and crypto_manager.verify_signature("after", signature)
+        assert service._pool is not broken_pool and service.stats["restarts"] == 1
+    finally:
+        crypto_manager.signer = None
+        service.shutdown()
+
+
+def test_bursts_are_split_across_workers(crypto_manager):
+    """One collected burst becomes one pool task per worker, not a single task signed on one core"""
+    service = SigningService(crypto_manager, workers=3, batch_window=0.05)
+    chunks = []
+    service._run_batch = chunks.append
+    for i in range(8):
+        service._queue.put(("kid", b"payload %d" % i, None, None))
+    service._queue.put(None)
+
+    service._dispatch()
+    assert [len(chunk) for chunk in chunks] == [3, 3, 2]
+    assert [item[1] for chunk in chunks for item in chunk] == [b"payload %d" % i for i in range(8)]
@@ -0,0 +1,28 @@
+"""
+Tests for the per-student credential version chains
+"""
+from core.version_index import CredentialVersionIndex
+
+
+def test_heads_and_lineage_follow_updates():
+    index = CredentialVersionIndex()
+    index.rebuild({
+        'v1': {'student_id': 'S1', 'version': 1, 'status': 'superseded', 'previous_credential_id': None},
+        'v2': {'student_id': 'S1', 'version': 2, 'status': 'active', 'previous_credential_id': 'v1'},
+        'x1': {'student_id': 'S2', 'version': 1, 'status': 'active', 'previous_credential_id': None},
+    })
+    assert index.head('S1') == 'v2' and index.latest_version('S1') == 2
+    assert index.latest_active('S1') == 'v2'
+    assert index.lineage('v2') == ['v2', 'v1']
+    assert index.versions('S1') == ['v2', 'v1']
+
+    index.add('v2', {'student_id': 'S1', 'version': 2, 'status': 'revoked', 'previous_credential_id': 'v1'})
+    assert index.head('S1') == 'v2' and index.latest_active('S1') is None
+
+    index.add('v3', {'student_id': 'S1', 'version': 3, 'status': 'active', 'previous_credential_id': 'v2'})
+    assert index.latest_active('S1') == 'v3'
+    assert index.lineage('v3') == ['v3', 'v2', 'v1']
+
+    index.remove('v3')
+    assert index.head('S1') == 'v2' and index.latest_version('S3') == 0
+    assert index.versions('S2') == ['x1'] and len(index) == 3